@@ -9,6 +9,10 @@ load_dotenv()
 
 class Settings:
     APP_NAME: str = "devops-mcp-server"
+    # Root log level; WARNING drops the per-request INFO lines in production
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    # Deployment environment; "production" disables the interactive API docs
+    ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development").lower()
 
     # Descope - optional for development
     DESCOPE_PROJECT_ID: Optional[str] = os.getenv("DESCOPE_PROJECT_ID")
@@ -23,6 +27,22 @@ class Settings:
         os.getenv("AUTH_ALLOW_ANONYMOUS", "false").lower() == "true"
     )
     AUTH_ACCEPT_COOKIE_NAME: str = os.getenv("AUTH_ACCEPT_COOKIE_NAME", "DS")
+    # Seconds a validated session is reused (never past the token's expiry)
+    SESSION_CACHE_TTL: float = float(os.getenv("SESSION_CACHE_TTL", "30"))
+    # Worker threads for blocking SDK calls (Descope session validation)
+    THREAD_POOL_SIZE: int = int(os.getenv("THREAD_POOL_SIZE", "64"))
+
+    # CORS - comma-separated allowed origins ("*" allows any origin)
+    CORS_ALLOW_ORIGINS: List[str] = [
+        origin.strip()
+        for origin in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
+        if origin.strip()
+    ]
+    # How long browsers may cache a preflight response, in seconds
+    CORS_MAX_AGE: int = int(os.getenv("CORS_MAX_AGE", "86400"))
+
+    # Seconds a direct-mode logs/metrics read is reused for identical requests
+    RESOURCE_CACHE_TTL: float = float(os.getenv("RESOURCE_CACHE_TTL", "2.0"))
 
     # Cequence Gateway Configuration
     CEQUENCE_GATEWAY_URL: Optional[str] = os.getenv("CEQUENCE_GATEWAY_URL")
@@ -28,7 +28,7 @@ from app.infrastructure.logs.logs_client import LogsClient
 from app.infrastructure.metrics.metrics_client import MetricsClient
 from app.infrastructure.rollback.rollback_client import RollbackClient
 
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 _security = HTTPBearer(auto_error=False)
 
@@ -72,7 +72,9 @@ async def get_current_user(
     if creds and creds.credentials:
         session_token = creds.credentials
         logger.info(
-            f"🔍 Found session token in Authorization header: {session_token[:20]}...{session_token[-10:] if len(session_token) > 30 else ''}"
+            "🔍 Found session token in Authorization header: %s...%s",
+            session_token[:20],
+            session_token[-10:] if len(session_token) > 30 else "",
         )
 
     # Extract refresh token from cookies
@@ -80,7 +82,8 @@ async def get_current_user(
     if REFRESH_SESSION_TOKEN_NAME in request.cookies:
         refresh_token = request.cookies[REFRESH_SESSION_TOKEN_NAME]
         logger.info(
-            f"🔍 Found refresh token in cookies: {refresh_token[:20] if refresh_token else 'None'}..."
+            "🔍 Found refresh token in cookies: %s...",
+            refresh_token[:20] if refresh_token else "None",
         )
 
     # Check if we have at least a session token
@@ -103,31 +106,25 @@ async def get_current_user(
     try:
         # Validate session token (with automatic refresh if refresh token is available)
         logger.info("🔄 Validating session token with Descope...")
-        jwt_response = descope_client.validate_session(
+        user_principal = await descope_client.aget_user_principal(
             session_token=session_token, refresh_token=refresh_token
         )
 
-        # Extract user principal from JWT response
-        logger.info("🔄 Extracting user principal from JWT response...")
-        user_principal = descope_client.extract_user_principal(
-            jwt_response, session_token
-        )
-
-        logger.info(f"✅ Authentication successful for user: {user_principal.user_id}")
-        logger.info(f"👤 User roles: {user_principal.roles}")
-        logger.info(f"🔑 User permissions: {user_principal.permissions}")
+        logger.info("✅ Authentication successful for user: %s", user_principal.user_id)
+        logger.info("👤 User roles: %s", user_principal.roles)
+        logger.info("🔑 User permissions: %s", user_principal.permissions)
 
         return user_principal
 
     except DescopeAuthError as e:
-        logger.error(f"❌ Authentication failed: {e.detail}")
+        logger.error("❌ Authentication failed: %s", e.detail)
         raise HTTPException(
             status_code=e.status_code,
             detail=e.detail,
             headers={"WWW-Authenticate": "Bearer"},
         )
     except Exception as e:
-        logger.error(f"❌ Unexpected authentication error: {e}")
+        logger.error("❌ Unexpected authentication error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Authentication service error",
@@ -145,8 +142,9 @@ def require_permissions(required_permissions: List[str]):
     Returns:
         Dependency function that validates permissions
     """
+    required_permissions_set = frozenset(required_permissions)
 
-    def permission_dependency(
+    async def permission_dependency(
         user: UserPrincipal = Depends(get_current_user),
     ) -> UserPrincipal:
         # Skip permission validation for anonymous users if allowed
@@ -155,12 +153,12 @@ def require_permissions(required_permissions: List[str]):
             return user
 
         # Check if user has any of the required permissions
-        user_permissions = set(user.permissions)
-        required_permissions_set = set(required_permissions)
-
-        if not user_permissions.intersection(required_permissions_set):
+        if required_permissions_set.isdisjoint(user.permission_set):
             logger.warning(
-                f"❌ Permission denied for user {user.user_id}: required={required_permissions}, user_has={user.permissions}"
+                "❌ Permission denied for user %s: required=%s, user_has=%s",
+                user.user_id,
+                required_permissions,
+                user.permissions,
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -168,7 +166,7 @@ def require_permissions(required_permissions: List[str]):
             )
 
         logger.info(
-            f"✅ Permission granted for user {user.user_id}: {required_permissions}"
+            "✅ Permission granted for user %s: %s", user.user_id, required_permissions
         )
         return user
 
@@ -185,23 +183,26 @@ def require_roles(required_roles: List[str]):
     Returns:
         Dependency function that validates roles
     """
+    required_roles_set = frozenset(required_roles)
 
-    def role_dependency(
+    async def role_dependency(
         user: UserPrincipal = Depends(get_current_user),
     ) -> UserPrincipal:
-        user_roles = set(user.roles)
-        required_roles_set = set(required_roles)
-
-        if not user_roles.intersection(required_roles_set):
+        if required_roles_set.isdisjoint(user.roles):
             logger.warning(
-                f"❌ Role access denied for user {user.user_id}: required={required_roles}, user_has={user.roles}"
+                "❌ Role access denied for user %s: required=%s, user_has=%s",
+                user.user_id,
+                required_roles,
+                user.roles,
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Insufficient roles. Required: {required_roles}",
             )
 
-        logger.info(f"✅ Role access granted for user {user.user_id}: {required_roles}")
+        logger.info(
+            "✅ Role access granted for user %s: %s", user.user_id, required_roles
+        )
         return user
 
     return role_dependency
@@ -222,17 +223,19 @@ def require_all_permissions(required_permissions: List[str]):
     Returns:
         Dependency function that validates all permissions are present
     """
+    required_permissions_set = frozenset(required_permissions)
 
-    def permission_dependency(
+    async def permission_dependency(
         user: UserPrincipal = Depends(get_current_user),
     ) -> UserPrincipal:
-        user_permissions = set(user.permissions)
-        required_permissions_set = set(required_permissions)
-
-        if not required_permissions_set.issubset(user_permissions):
-            missing_permissions = required_permissions_set - user_permissions
+        if not required_permissions_set.issubset(user.permission_set):
+            missing_permissions = required_permissions_set.difference(
+                user.permission_set
+            )
             logger.warning(
-                f"❌ Missing permissions for user {user.user_id}: missing={list(missing_permissions)}"
+                "❌ Missing permissions for user %s: missing=%s",
+                user.user_id,
+                list(missing_permissions),
             )
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -240,7 +243,9 @@ def require_all_permissions(required_permissions: List[str]):
             )
 
         logger.info(
-            f"✅ All permissions granted for user {user.user_id}: {required_permissions}"
+            "✅ All permissions granted for user %s: %s",
+            user.user_id,
+            required_permissions,
         )
         return user
 
@@ -258,21 +263,20 @@ require_rollback_write = require_permissions(["rollback_write"])
 
 
 # Convenience dependencies for deployment and rollback access (flexible permissions)
+_DEPLOYMENT_PERMISSIONS = frozenset(
+    {"read_deployments", "deploy_staging", "deploy_production"}
+)
+_ROLLBACK_PERMISSIONS = frozenset({"read_rollbacks", "rollback_write"})
+
+
 def require_deployment_access():
     """Require any deployment-related permission."""
 
-    def permission_dependency(
+    async def permission_dependency(
         user: UserPrincipal = Depends(get_current_user),
     ) -> UserPrincipal:
-        deployment_permissions = {
-            "read_deployments",
-            "deploy_staging",
-            "deploy_production",
-        }
-        user_permissions = set(user.permissions)
-
-        if not user_permissions.intersection(deployment_permissions):
-            logger.warning(f"❌ No deployment access for user {user.user_id}")
+        if _DEPLOYMENT_PERMISSIONS.isdisjoint(user.permission_set):
+            logger.warning("❌ No deployment access for user %s", user.user_id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="No deployment access permissions",
@@ -286,14 +290,11 @@ def require_deployment_access():
 def require_rollback_access():
     """Require any rollback-related permission."""
 
-    def permission_dependency(
+    async def permission_dependency(
         user: UserPrincipal = Depends(get_current_user),
     ) -> UserPrincipal:
-        rollback_permissions = {"read_rollbacks", "rollback_write"}
-        user_permissions = set(user.permissions)
-
-        if not user_permissions.intersection(rollback_permissions):
-            logger.warning(f"❌ No rollback access for user {user.user_id}")
+        if _ROLLBACK_PERMISSIONS.isdisjoint(user.permission_set):
+            logger.warning("❌ No rollback access for user %s", user.user_id)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="No rollback access permissions",
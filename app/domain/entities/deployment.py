@@ -1,6 +1,7 @@
 from datetime import datetime
+from typing import List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 
 class Deployment(BaseModel):
@@ -10,3 +11,7 @@ class Deployment(BaseModel):
     environment: str
     status: str
     timestamp: datetime
+
+
+# Dump whole lists in one pydantic-core call instead of per item
+DEPLOYMENT_LIST_ADAPTER = TypeAdapter(List[Deployment])
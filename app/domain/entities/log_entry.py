@@ -1,9 +1,31 @@
+import logging
 from datetime import datetime
+from typing import Any, Dict, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
 
 
 class LogEntry(BaseModel):
     timestamp: datetime
     level: str
     message: str
+    source: str = "system"
+
+
+# Validate and dump whole lists in one pydantic-core call instead of per item
+LOG_LIST_ADAPTER = TypeAdapter(List[LogEntry])
+
+
+def validate_log_batch(rows: List[Dict[str, Any]]) -> List[LogEntry]:
+    """Validate a batch of raw log rows into LogEntry entities, skipping invalid rows."""
+    try:
+        return LOG_LIST_ADAPTER.validate_python(rows)
+    except ValidationError as e:
+        # Errors are reported for every bad item, so one retry without them passes
+        invalid = {error["loc"][0] for error in e.errors()}
+        logger.warning("Failed to parse %d log entries: %s", len(invalid), e)
+        return LOG_LIST_ADAPTER.validate_python(
+            [row for index, row in enumerate(rows) if index not in invalid]
+        )
@@ -1,6 +1,10 @@
+import logging
 from datetime import datetime
+from typing import Any, Dict, List
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
 
 
 class Metric(BaseModel):
@@ -8,3 +12,20 @@ class Metric(BaseModel):
     name: str
     value: float
     unit: str
+
+
+# Validate and dump whole lists in one pydantic-core call instead of per item
+METRIC_LIST_ADAPTER = TypeAdapter(List[Metric])
+
+
+def validate_metric_batch(rows: List[Dict[str, Any]]) -> List[Metric]:
+    """Validate a batch of raw metric rows into Metric entities, skipping invalid rows."""
+    try:
+        return METRIC_LIST_ADAPTER.validate_python(rows)
+    except ValidationError as e:
+        # Errors are reported for every bad item, so one retry without them passes
+        invalid = {error["loc"][0] for error in e.errors()}
+        logger.warning("Failed to parse %d metric entries: %s", len(invalid), e)
+        return METRIC_LIST_ADAPTER.validate_python(
+            [row for index, row in enumerate(rows) if index not in invalid]
+        )
@@ -1,9 +1,9 @@
+from dataclasses import dataclass
 from datetime import datetime
 
-from pydantic import BaseModel
 
-
-class Rollback(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Rollback:
     rollback_id: str
     deployment_id: str
     status: str
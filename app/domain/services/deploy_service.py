@@ -1,6 +1,6 @@
 from typing import Any, Dict, Tuple
 
-from app.domain.entities.deployment import Deployment
+from app.domain.entities.deployment import DEPLOYMENT_LIST_ADAPTER, Deployment
 from app.infrastructure.cicd.cicd_client import CICDClient
 
 
@@ -28,7 +28,9 @@ class DeployService:
         successful_deployments = [dep for dep in deployments if dep.status == "SUCCESS"]
 
         # Update JSON response to reflect filtered results
-        json_response["deployments"] = [dep.dict() for dep in successful_deployments]
+        json_response["deployments"] = DEPLOYMENT_LIST_ADAPTER.dump_python(
+            successful_deployments
+        )
         json_response["count"] = len(successful_deployments)
         json_response["message"] = (
             f"Retrieved {len(successful_deployments)} successful deployments"
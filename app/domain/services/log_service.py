@@ -25,13 +25,8 @@ class LogService:
     ):
         """Get recent logs with optional filtering."""
         if self.client_type == "datadog":
-            # Datadog client handles level filtering internally
+            # Datadog client applies level and limit in the query
             return await self.client.fetch_data(level=level, limit=limit)
         else:
-            # Mock client - apply level filter manually
-            logs = await self.client.fetch_logs()
-            if level:
-                logs = [log for log in logs if log.level == level]
-            if limit:
-                logs = logs[:limit]
-            return logs
+            # Mock client applies level and limit while generating
+            return await self.client.fetch_logs(level=level, limit=limit)
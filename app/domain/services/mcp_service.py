@@ -8,6 +8,8 @@ abstracting away the complexity of gateway routing.
 import logging
 from typing import Any, Dict, Optional
 
+from fastapi import HTTPException
+
 from app.infrastructure.gateway.router_factory import RouterFactory
 from app.schemas.auth import UserPrincipal
 
@@ -25,6 +27,16 @@ class MCPResourceService:
     def __init__(self):
         """Initialize the MCP resource service."""
         self.router = RouterFactory.get_router()
+        self._fallback_router = None
+
+    def _get_fallback_router(self):
+        """Get the direct router used when Cequence fails, creating it once."""
+        if self._fallback_router is None:
+            from app.infrastructure.gateway.direct_router import DirectRouter
+
+            # Reused so its read cache survives across fallback requests
+            self._fallback_router = DirectRouter()
+        return self._fallback_router
 
     async def get_logs(
         self,
@@ -51,14 +63,15 @@ class MCPResourceService:
             return await self.router.get_logs(
                 headers=headers, user=user, level=level, limit=limit, since=since
             )
+        except HTTPException:
+            # Permission and validation errors apply in every mode; don't fall back
+            raise
         except Exception as e:
-            logger.error(f"❌ Error in MCP resource service getting logs: {e}")
+            logger.error("❌ Error in MCP resource service getting logs: %s", e)
             # Fallback to direct mode if Cequence fails
             if RouterFactory.get_router_type() == "cequence":
                 logger.info("🔄 Falling back to direct mode for logs")
-                from app.infrastructure.gateway.direct_router import DirectRouter
-
-                direct_router = DirectRouter()
+                direct_router = self._get_fallback_router()
                 return await direct_router.get_logs(
                     headers=headers, user=user, level=level, limit=limit, since=since
                 )
@@ -87,14 +100,15 @@ class MCPResourceService:
             return await self.router.get_metrics(
                 headers=headers, user=user, limit=limit, service=service
             )
+        except HTTPException:
+            # Permission and validation errors apply in every mode; don't fall back
+            raise
         except Exception as e:
-            logger.error(f"❌ Error in MCP resource service getting metrics: {e}")
+            logger.error("❌ Error in MCP resource service getting metrics: %s", e)
             # Fallback to direct mode if Cequence fails
             if RouterFactory.get_router_type() == "cequence":
                 logger.info("🔄 Falling back to direct mode for metrics")
-                from app.infrastructure.gateway.direct_router import DirectRouter
-
-                direct_router = DirectRouter()
+                direct_router = self._get_fallback_router()
                 return await direct_router.get_metrics(
                     headers=headers, user=user, limit=limit, service=service
                 )
@@ -142,8 +156,11 @@ class MCPToolService:
                 version=version,
                 environment=environment,
             )
+        except HTTPException:
+            # Permission and validation errors apply in every mode; don't fall back
+            raise
         except Exception as e:
-            logger.error(f"❌ Error in MCP tool service deploying service: {e}")
+            logger.error("❌ Error in MCP tool service deploying service: %s", e)
             # Fallback to direct mode if Cequence fails
             if RouterFactory.get_router_type() == "cequence":
                 logger.info("🔄 Falling back to direct mode for deploy service")
@@ -188,8 +205,11 @@ class MCPToolService:
                 reason=reason,
                 environment=environment,
             )
+        except HTTPException:
+            # Permission and validation errors apply in every mode; don't fall back
+            raise
         except Exception as e:
-            logger.error(f"❌ Error in MCP tool service rolling back deployment: {e}")
+            logger.error("❌ Error in MCP tool service rolling back deployment: %s", e)
             # Fallback to direct mode if Cequence fails
             if RouterFactory.get_router_type() == "cequence":
                 logger.info("🔄 Falling back to direct mode for rollback deployment")
@@ -231,8 +251,11 @@ class MCPToolService:
                 session_token=session_token,
                 refresh_token=refresh_token,
             )
+        except HTTPException:
+            # Permission and validation errors apply in every mode; don't fall back
+            raise
         except Exception as e:
-            logger.error(f"❌ Error in MCP tool service authenticating user: {e}")
+            logger.error("❌ Error in MCP tool service authenticating user: %s", e)
             # Fallback to direct mode if Cequence fails
             if RouterFactory.get_router_type() == "cequence":
                 logger.info("🔄 Falling back to direct mode for authenticate user")
@@ -31,10 +31,12 @@ class MetricsService:
             limit: If provided, limit the number of metrics returned (for Cequence optimization)
         """
         if self.client_type == "datadog":
-            return await self.client.fetch_data(
+            metrics = await self.client.fetch_data(
                 user_permissions=user_permissions,
                 fetch_historical=fetch_historical,
                 limit=limit,
             )
+            # The Datadog client caches the full batch, so limit it here
+            return metrics[:limit] if limit else metrics
         else:
-            return await self.client.fetch_metrics()
+            return await self.client.fetch_metrics(limit=limit)
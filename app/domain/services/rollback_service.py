@@ -1,3 +1,4 @@
+from dataclasses import asdict
 from typing import Any, Dict, Tuple
 
 from app.domain.entities.rollback import Rollback
@@ -26,7 +27,7 @@ class RollbackService:
         successful_rollbacks = [rb for rb in rollbacks if rb.status == "SUCCESS"]
 
         # Update JSON response to reflect filtered results
-        json_response["rollbacks"] = [rb.dict() for rb in successful_rollbacks]
+        json_response["rollbacks"] = [asdict(rb) for rb in successful_rollbacks]
         json_response["count"] = len(successful_rollbacks)
         json_response["message"] = (
             f"Retrieved {len(successful_rollbacks)} successful rollbacks"
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from fastapi import HTTPException, status
 
 from app.config import settings
 from app.schemas.auth import UserPrincipal
+from app.utils.single_flight import SingleFlight
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +25,49 @@ except ImportError:
     DescopeClient = None
     AuthException = None
 
+# Role to permission sets, built once from the static settings mapping
+_ROLE_PERMISSION_SETS = {
+    role: frozenset(permissions)
+    for role, permissions in settings.ROLE_PERMISSIONS.items()
+}
+_NO_PERMISSIONS: frozenset = frozenset()
+_get_role_permissions = _ROLE_PERMISSION_SETS.get
+
+
+@lru_cache(maxsize=128)
+def _permissions_for_roles(roles: FrozenSet[str]) -> FrozenSet[str]:
+    """Return the union of the permissions mapped to the given roles."""
+    return _NO_PERMISSIONS.union(
+        *(_get_role_permissions(role, _NO_PERMISSIONS) for role in roles)
+    )
+
+
+def session_cache_key(
+    session_token: str,
+    refresh_token: Optional[str] = None,
+    audience: Optional[str] = None,
+) -> str:
+    """Hash the validation inputs so raw tokens are never kept as cache keys."""
+    digest = hashlib.sha256(session_token.encode())
+    if refresh_token:
+        digest.update(b"\0" + refresh_token.encode())
+    if audience:
+        digest.update(b"\0" + audience.encode())
+    return digest.hexdigest()
+
+
+def _seconds_until_expiry(jwt_response: Dict[str, Any]) -> Optional[float]:
+    """Return seconds until the session's ``exp`` claim, or None if absent."""
+    exp = jwt_response.get("exp")
+    if exp is None:
+        session = jwt_response.get("sessionToken")
+        if isinstance(session, dict):
+            exp = session.get("exp")
+    try:
+        return float(exp) - time.time()
+    except (TypeError, ValueError):
+        return None
+
 
 class DescopeAuthError(HTTPException):
     def __init__(self, detail: str, status_code: int = status.HTTP_401_UNAUTHORIZED):
@@ -33,6 +82,12 @@ class DescopeAuthClient:
 
     def __init__(self):
         """Initialize the Descope client with project configuration."""
+        # Principals of validated sessions by token hash, so repeat calls
+        # skip verification and claim extraction
+        self._session_cache = TTLCache(ttl=settings.SESSION_CACHE_TTL)
+        # Concurrent misses for the same token share one validation
+        self._inflight_validations = SingleFlight(ttl=0)
+
         if not DESCOPE_AVAILABLE:
             logger.warning(
                 "⚠️ Descope SDK not available - authentication will be disabled"
@@ -51,10 +106,11 @@ class DescopeAuthClient:
             # Initialize Descope client with project ID
             self.client = DescopeClient(project_id=settings.DESCOPE_PROJECT_ID)
             logger.info(
-                f"✅ Descope client initialized for project: {settings.DESCOPE_PROJECT_ID}"
+                "✅ Descope client initialized for project: %s",
+                settings.DESCOPE_PROJECT_ID,
             )
         except Exception as error:
-            logger.error(f"❌ Failed to initialize Descope client: {error}")
+            logger.error("❌ Failed to initialize Descope client: %s", error)
             self.client = None
 
     def is_configured(self) -> bool:
@@ -87,10 +143,12 @@ class DescopeAuthClient:
         try:
             logger.info("🔄 Validating session token...")
             logger.info(
-                f"🔍 Token preview: {session_token[:20]}...{session_token[-10:] if len(session_token) > 30 else ''}"
+                "🔍 Token preview: %s...%s",
+                session_token[:20],
+                session_token[-10:] if len(session_token) > 30 else "",
             )
-            logger.info(f"🔍 Audience: {audience or 'None'}")
-            logger.info(f"🔍 Has refresh token: {bool(refresh_token)}")
+            logger.info("🔍 Audience: %s", audience or "None")
+            logger.info("🔍 Has refresh token: %s", bool(refresh_token))
 
             # Try to validate and refresh session if refresh token is available
             if refresh_token:
@@ -112,18 +170,92 @@ class DescopeAuthClient:
 
             logger.info("✅ Session validation successful")
             logger.info(
-                f"📋 JWT response keys: {list(jwt_response.keys()) if isinstance(jwt_response, dict) else 'Not a dict'}"
+                "📋 JWT response keys: %s",
+                (
+                    list(jwt_response.keys())
+                    if isinstance(jwt_response, dict)
+                    else "Not a dict"
+                ),
             )
 
             return jwt_response
 
         except AuthException as e:
-            logger.error(f"❌ Session validation failed: {e}")
+            logger.error("❌ Session validation failed: %s", e)
             raise DescopeAuthError(f"Session validation error: {e}")
         except Exception as e:
-            logger.error(f"❌ Unexpected error during session validation: {e}")
+            logger.error("❌ Unexpected error during session validation: %s", e)
             raise DescopeAuthError(f"Session validation error: {e}")
 
+    async def avalidate_session(
+        self,
+        session_token: str,
+        refresh_token: Optional[str] = None,
+        audience: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Validate session token without blocking the event loop.
+
+        The Descope SDK is synchronous and validation may hit the network
+        (key fetch, refresh), so the call runs in a worker thread.
+
+        Args:
+            session_token: The session token to validate
+            refresh_token: Optional refresh token for automatic refresh
+            audience: Optional audience claim to validate
+
+        Returns:
+            JWT response with user claims and permissions
+
+        Raises:
+            DescopeAuthError: If validation fails
+        """
+        return await asyncio.to_thread(
+            self.validate_session, session_token, refresh_token, audience
+        )
+
+    async def aget_user_principal(
+        self,
+        session_token: str,
+        refresh_token: Optional[str] = None,
+        audience: Optional[str] = None,
+    ) -> UserPrincipal:
+        """
+        Validate a session and return its user principal.
+
+        The extracted principal is cached briefly, never beyond the token's
+        expiry, so repeat calls skip both validation and claim extraction.
+        Concurrent calls for the same token share a single validation.
+
+        Args:
+            session_token: The session token to validate
+            refresh_token: Optional refresh token for automatic refresh
+            audience: Optional audience claim to validate
+
+        Returns:
+            UserPrincipal with user data and permissions
+
+        Raises:
+            DescopeAuthError: If validation or extraction fails
+        """
+        key = session_cache_key(session_token, refresh_token, audience)
+        user_principal = self._session_cache.get(key)
+        if user_principal is not None:
+            logger.debug("⚡ Session cache hit")
+            return user_principal
+
+        async def validate_and_cache() -> UserPrincipal:
+            jwt_response = await self.avalidate_session(
+                session_token, refresh_token, audience
+            )
+            user_principal = self.extract_user_principal(jwt_response, session_token)
+            self._session_cache.set(
+                key, user_principal, _seconds_until_expiry(jwt_response)
+            )
+            return user_principal
+
+        return await self._inflight_validations.run(key, validate_and_cache)
+
     def refresh_session(self, refresh_token: str) -> Dict[str, Any]:
         """
         Refresh an expired session using the refresh token.
@@ -147,10 +279,10 @@ class DescopeAuthClient:
             return jwt_response
 
         except AuthException as e:
-            logger.error(f"❌ Session refresh failed: {e}")
+            logger.error("❌ Session refresh failed: %s", e)
             raise DescopeAuthError(f"Session refresh error: {e}")
         except Exception as e:
-            logger.error(f"❌ Unexpected error during session refresh: {e}")
+            logger.error("❌ Unexpected error during session refresh: %s", e)
             raise DescopeAuthError(f"Session refresh error: {e}")
 
     def logout(self, refresh_token: str) -> bool:
@@ -176,10 +308,10 @@ class DescopeAuthClient:
             return True
 
         except AuthException as e:
-            logger.error(f"❌ Logout failed: {e}")
+            logger.error("❌ Logout failed: %s", e)
             raise DescopeAuthError(f"Logout error: {e}")
         except Exception as e:
-            logger.error(f"❌ Unexpected error during logout: {e}")
+            logger.error("❌ Unexpected error during logout: %s", e)
             raise DescopeAuthError(f"Logout error: {e}")
 
     def extract_user_principal(
@@ -208,7 +340,7 @@ class DescopeAuthClient:
             tenant = jwt_response.get("tenant") or jwt_response.get("tenantId")
 
             # Use Descope SDK methods to get matched roles and permissions
-            logger.info(f"🔍 Tenant from JWT: {tenant}")
+            logger.info("🔍 Tenant from JWT: %s", tenant)
 
             # Get matched roles from available roles in system
             roles = self.get_matched_roles(jwt_response, settings.AVAILABLE_ROLES)
@@ -221,24 +353,21 @@ class DescopeAuthClient:
             # If no permissions found but we have roles, derive from role mappings
             if not permissions and roles:
                 logger.info(
-                    f"🔍 No direct permissions found, deriving from roles: {roles}"
+                    "🔍 No direct permissions found, deriving from roles: %s", roles
+                )
+                derived_permissions = _permissions_for_roles(frozenset(roles))
+                logger.info(
+                    "🔍 Roles map to permissions: %s", sorted(derived_permissions)
                 )
-                derived_permissions = []
-                for role in roles:
-                    role_permissions = settings.ROLE_PERMISSIONS.get(role, [])
-                    logger.info(
-                        f"🔍 Role '{role}' maps to permissions: {role_permissions}"
-                    )
-                    derived_permissions.extend(role_permissions)
 
                 # Get matched permissions from derived permissions
                 if derived_permissions:
                     permissions = self.get_matched_permissions(
-                        jwt_response, list(set(derived_permissions))
+                        jwt_response, list(derived_permissions)
                     )
 
-            logger.info(f"🔍 Final matched user roles: {roles}")
-            logger.info(f"🔍 Final matched user permissions: {permissions}")
+            logger.info("🔍 Final matched user roles: %s", roles)
+            logger.info("🔍 Final matched user permissions: %s", permissions)
 
             return UserPrincipal(
                 user_id=str(user_id) if user_id else "unknown",
@@ -256,7 +385,7 @@ class DescopeAuthClient:
             )
 
         except Exception as e:
-            logger.error(f"❌ Error extracting user principal: {e}")
+            logger.error("❌ Error extracting user principal: %s", e)
             raise DescopeAuthError(f"Error extracting user data: {e}")
 
     def validate_permissions(
@@ -277,7 +406,7 @@ class DescopeAuthClient:
             return False
 
         try:
-            logger.info(f"🔍 Validating permissions: {required_permissions}")
+            logger.info("🔍 Validating permissions: %s", required_permissions)
             is_permission_valid = self.client.validate_permissions(
                 jwt_response, required_permissions
             )
@@ -291,7 +420,8 @@ class DescopeAuthClient:
 
         except Exception as e:
             logger.error(
-                f"❌ Could not confirm if permissions are valid - error prior to confirmation: {e}"
+                "❌ Could not confirm if permissions are valid - error prior to confirmation: %s",
+                e,
             )
             return False
 
@@ -313,7 +443,7 @@ class DescopeAuthClient:
             return False
 
         try:
-            logger.info(f"🔍 Validating roles: {required_roles}")
+            logger.info("🔍 Validating roles: %s", required_roles)
             is_role_valid = self.client.validate_roles(jwt_response, required_roles)
 
             if is_role_valid:
@@ -325,7 +455,8 @@ class DescopeAuthClient:
 
         except Exception as e:
             logger.error(
-                f"❌ Could not confirm if roles are valid - error prior to confirmation: {e}"
+                "❌ Could not confirm if roles are valid - error prior to confirmation: %s",
+                e,
             )
             return False
 
@@ -348,15 +479,15 @@ class DescopeAuthClient:
             return []
 
         try:
-            logger.info(f"🔍 Getting matched permissions for: {permissions_to_match}")
+            logger.info("🔍 Getting matched permissions for: %s", permissions_to_match)
             matched_permissions = self.client.get_matched_permissions(
                 jwt_response, permissions_to_match
             )
-            logger.info(f"✅ Matched permissions: {matched_permissions}")
+            logger.info("✅ Matched permissions: %s", matched_permissions)
             return matched_permissions
 
         except Exception as e:
-            logger.error(f"❌ Could not get matched permissions - error: {e}")
+            logger.error("❌ Could not get matched permissions - error: %s", e)
             return []
 
     def get_matched_roles(
@@ -378,13 +509,13 @@ class DescopeAuthClient:
             return []
 
         try:
-            logger.info(f"🔍 Getting matched roles for: {roles_to_match}")
+            logger.info("🔍 Getting matched roles for: %s", roles_to_match)
             matched_roles = self.client.get_matched_roles(jwt_response, roles_to_match)
-            logger.info(f"✅ Matched roles: {matched_roles}")
+            logger.info("✅ Matched roles: %s", matched_roles)
             return matched_roles
 
         except Exception as e:
-            logger.error(f"❌ Could not get matched roles - error: {e}")
+            logger.error("❌ Could not get matched roles - error: %s", e)
             return []
 
 
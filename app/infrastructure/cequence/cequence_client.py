@@ -6,14 +6,31 @@ Implements MCP Streamable HTTP transport protocol.
 import json
 import logging
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional
 
 import httpx
 
 from app.config import settings
+from app.infrastructure.http_client import close_http_client, get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Inbound headers the gateway calls forward; everything else is dropped
+FORWARDED_HEADERS = ("authorization", "cookie")
+
+
+def forwarded_headers(headers: Mapping[str, str]) -> Dict[str, str]:
+    """
+    Copy only the inbound request headers that are forwarded to the gateway.
+
+    Args:
+        headers: Incoming request headers
+
+    Returns:
+        Lower-cased header dict limited to FORWARDED_HEADERS
+    """
+    return {name: headers[name] for name in FORWARDED_HEADERS if name in headers}
+
 
 class CequenceClient:
     """
@@ -30,13 +47,12 @@ class CequenceClient:
     def __init__(self):
         self.gateway_url = settings.CEQUENCE_GATEWAY_URL
         self.enabled = settings.CEQUENCE_ENABLED and self.gateway_url is not None
-        self.client = httpx.AsyncClient(timeout=30.0)
         self.session_id = None
         self.initialized = False
         self.protocol_version = "2024-11-05"
 
         if self.enabled:
-            logger.info(f"🌐 Cequence Gateway enabled: {self.gateway_url}")
+            logger.info("🌐 Cequence Gateway enabled: %s", self.gateway_url)
         else:
             if not settings.CEQUENCE_ENABLED:
                 logger.info("🔧 Cequence Gateway disabled - direct mode")
@@ -85,22 +101,23 @@ class CequenceClient:
                 self.session_id = response.headers.get("Mcp-Session-Id")
                 self.initialized = True
                 logger.info(
-                    f"✅ MCP Gateway initialized with session: {self.session_id}"
+                    "✅ MCP Gateway initialized with session: %s", self.session_id
                 )
 
                 # Send InitializedNotification as required by MCP protocol
                 await self._send_initialized_notification()
             else:
                 logger.warning(
-                    f"⚠️ MCP Gateway initialization failed: {response.status_code}"
+                    "⚠️ MCP Gateway initialization failed: %s", response.status_code
                 )
-                logger.debug(f"Response: {response.text}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response: %s", response.text)
                 raise Exception(
                     f"Gateway initialization failed: {response.status_code}"
                 )
 
         except Exception as e:
-            logger.error(f"❌ Failed to initialize MCP Gateway: {e}")
+            logger.error("❌ Failed to initialize MCP Gateway: %s", e)
             raise
 
     async def _send_initialized_notification(self):
@@ -128,7 +145,9 @@ class CequenceClient:
         if response.status_code == 202:
             logger.info("✅ InitializedNotification sent successfully")
         else:
-            logger.warning(f"⚠️ InitializedNotification failed: {response.status_code}")
+            logger.warning(
+                "⚠️ InitializedNotification failed: %s", response.status_code
+            )
 
     def _get_mcp_headers(self, stream: bool = False) -> Dict[str, str]:
         """Get standard MCP headers for requests.
@@ -196,9 +215,9 @@ class CequenceClient:
         request_headers.setdefault("Content-Type", "application/json")
         request_headers.setdefault("User-Agent", "DevOps-MCP-Server/1.0")
 
-        logger.info(f"🌐 Forwarding {method} {path} through Cequence Gateway")
-        logger.debug(f"🔍 Full URL: {url}")
-        logger.debug(f"🔍 Headers: {dict(request_headers)}")
+        logger.info("🌐 Forwarding %s %s through Cequence Gateway", method, path)
+        logger.debug("🔍 Full URL: %s", url)
+        logger.debug("🔍 Headers: %s", dict(request_headers))
 
         try:
             response = await self.client.request(
@@ -209,14 +228,14 @@ class CequenceClient:
                 json=json_data,
             )
 
-            logger.info(f"✅ Cequence response: {response.status_code}")
+            logger.info("✅ Cequence response: %s", response.status_code)
             return response
 
         except httpx.RequestError as e:
-            logger.error(f"❌ Cequence Gateway request failed: {e}")
+            logger.error("❌ Cequence Gateway request failed: %s", e)
             raise
         except httpx.HTTPStatusError as e:
-            logger.error(f"❌ Cequence Gateway HTTP error: {e.response.status_code}")
+            logger.error("❌ Cequence Gateway HTTP error: %s", e.response.status_code)
             raise
 
     async def get_logs(
@@ -246,7 +265,10 @@ class CequenceClient:
             "params": {"name": "getMcpResourcesLogs", "arguments": arguments},
         }
 
-        logger.info(f"🔍 MCP request for logs: {json.dumps(mcp_request, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "🔍 MCP request for logs: %s", json.dumps(mcp_request, indent=2)
+            )
 
         request_headers = self._get_mcp_headers(stream=False)
         # Forward authorization headers
@@ -263,17 +285,17 @@ class CequenceClient:
                         first_occurrence[name] = part.strip()
             request_headers["Cookie"] = "; ".join(first_occurrence.values())
 
-        logger.info(f"🔍 Request headers: {request_headers}")
-        logger.info(f"🔍 Gateway URL: {self.gateway_url}")
+        logger.info("🔍 Request headers: %s", request_headers)
+        logger.info("🔍 Gateway URL: %s", self.gateway_url)
 
         response = await self.client.post(
             self.gateway_url, json=mcp_request, headers=request_headers
         )
 
-        logger.info(f"🔍 Response status: {response.status_code}")
-        logger.info(f"🔍 Response headers: {dict(response.headers)}")
+        logger.info("🔍 Response status: %s", response.status_code)
+        logger.info("🔍 Response headers: %s", dict(response.headers))
         if response.status_code != 200:
-            logger.warning(f"🔍 Response content: {response.text[:500]}")
+            logger.warning("🔍 Response content: %r", response.content[:500])
 
         return response
 
@@ -298,7 +320,10 @@ class CequenceClient:
             "params": {"name": "getMcpResourcesMetrics", "arguments": arguments},
         }
 
-        logger.info(f"🔍 MCP request for metrics: {json.dumps(mcp_request, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "🔍 MCP request for metrics: %s", json.dumps(mcp_request, indent=2)
+            )
 
         request_headers = self._get_mcp_headers(stream=False)
         # Forward authorization headers
@@ -315,17 +340,17 @@ class CequenceClient:
                         first_occurrence[name] = part.strip()
             request_headers["Cookie"] = "; ".join(first_occurrence.values())
 
-        logger.info(f"🔍 Request headers: {request_headers}")
-        logger.info(f"🔍 Gateway URL: {self.gateway_url}")
+        logger.info("🔍 Request headers: %s", request_headers)
+        logger.info("🔍 Gateway URL: %s", self.gateway_url)
 
         response = await self.client.post(
             self.gateway_url, json=mcp_request, headers=request_headers
         )
 
-        logger.info(f"🔍 Response status: {response.status_code}")
-        logger.info(f"🔍 Response headers: {dict(response.headers)}")
+        logger.info("🔍 Response status: %s", response.status_code)
+        logger.info("🔍 Response headers: %s", dict(response.headers))
         if response.status_code != 200:
-            logger.warning(f"🔍 Response content: {response.text[:500]}")
+            logger.warning("🔍 Response content: %r", response.content[:500])
 
         return response
 
@@ -481,9 +506,14 @@ class CequenceClient:
             self.gateway_url, json=mcp_request, headers=request_headers
         )
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client."""
+        return get_http_client()
+
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the shared HTTP client."""
+        await close_http_client()
 
     def __del__(self):
         """Cleanup on deletion."""
@@ -0,0 +1,87 @@
+"""
+MCP response parsing for Cequence Gateway calls.
+
+The gateway answers MCP JSON-RPC requests either as plain JSON or as a
+Server-Sent Events stream of ``data: {json}`` lines. Both are parsed from the
+raw response bytes.
+"""
+
+import json
+import logging
+from typing import Any, Iterator
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+_SSE_DATA_PREFIX = b"data: "
+_NO_RESULT = object()
+
+
+def _iter_sse_data(body: bytes) -> Iterator[bytes]:
+    """Yield the payload of each ``data:`` line, scanning the raw bytes lazily."""
+    start = 0
+    end = len(body)
+    while start < end:
+        newline = body.find(b"\n", start)
+        if newline == -1:
+            newline = end
+        if body.startswith(_SSE_DATA_PREFIX, start, newline):
+            yield body[start + len(_SSE_DATA_PREFIX) : newline]
+        start = newline + 1
+
+
+def _unwrap(mcp_response: Any) -> Any:
+    """Return the JSON-RPC result, or _NO_RESULT if the message carries neither."""
+    if "result" in mcp_response:
+        return mcp_response["result"]
+    if "error" in mcp_response:
+        logger.warning("⚠️ MCP error from gateway: %s", mcp_response["error"])
+        raise Exception(f"Gateway returned error: {mcp_response['error']['message']}")
+    return _NO_RESULT
+
+
+def parse_mcp_gateway_response(response: httpx.Response) -> Any:
+    """
+    Parse an MCP response from the Cequence Gateway.
+
+    Args:
+        response: Gateway response in JSON or SSE format
+
+    Returns:
+        The ``result`` member of the JSON-RPC response
+
+    Raises:
+        Exception: If the gateway returned an error or an unparseable body
+    """
+    try:
+        if response.headers.get("content-type", "").startswith("text/event-stream"):
+            # Parse SSE format: "data: {json}\n\n"
+            for payload in _iter_sse_data(response.content):
+                result = _unwrap(_loads(payload))
+                if result is not _NO_RESULT:
+                    return result
+            raise Exception("No valid data found in SSE response")
+
+        mcp_response = _loads(response.content)
+        result = _unwrap(mcp_response)
+        if result is _NO_RESULT:
+            logger.warning("⚠️ Unexpected MCP response format: %s", mcp_response)
+            raise Exception("Unexpected response format from gateway")
+        return result
+    except ValueError as e:
+        # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+        logger.warning("⚠️ Failed to parse Cequence response: %s", e)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response content: %s", response.content[:500])
+        raise Exception("Invalid response from gateway")
@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, Tuple
 
-from app.domain.entities.deployment import Deployment
+from app.domain.entities.deployment import DEPLOYMENT_LIST_ADAPTER, Deployment
 
 
 class CICDClient:
@@ -72,7 +72,7 @@ class CICDClient:
         # Create JSON response
         json_response = {
             "success": status in ["SUCCESS", "IN_PROGRESS"],
-            "deployment": deployment.dict(),
+            "deployment": deployment.model_dump(),
             "message": self._get_deployment_message(status, service_name, environment),
             "metadata": {
                 "deployment_id": deployment_id,
@@ -171,7 +171,7 @@ class CICDClient:
         # Create JSON response
         json_response = {
             "success": True,
-            "deployments": [deployment.dict() for deployment in sorted_deployments],
+            "deployments": DEPLOYMENT_LIST_ADAPTER.dump_python(sorted_deployments),
             "count": len(sorted_deployments),
             "message": f"Retrieved {len(sorted_deployments)} recent deployments",
             "metadata": {
@@ -7,6 +7,11 @@ from typing import Dict
 import httpx
 
 from app.config import settings
+from app.infrastructure.http_client import (
+    CONNECT_TIMEOUT,
+    close_http_client,
+    get_http_client,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +20,17 @@ class BaseDatadogClient(ABC):
     """Base class for Datadog API clients with common functionality."""
 
     def __init__(self, timeout: float = 30.0):
-        """Initialize the HTTP client."""
-        self.client = httpx.AsyncClient(timeout=timeout)
+        """Initialize the client settings; HTTP connections come from the shared pool."""
+        self._timeout = httpx.Timeout(timeout, connect=min(timeout, CONNECT_TIMEOUT))
         self._api_key = settings.datadog_api_key
         self._app_key = settings.datadog_app_key
         self._service_name = settings.DATADOG_SERVICE_NAME
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client."""
+        return get_http_client()
+
     def _get_headers(self, content_type: str = "application/json") -> Dict[str, str]:
         """Get standard Datadog API headers."""
         headers = {
@@ -38,16 +48,17 @@ class BaseDatadogClient(ABC):
 
     async def _make_request(self, method: str, url: str, **kwargs) -> httpx.Response:
         """Make HTTP request with error handling."""
+        kwargs.setdefault("timeout", self._timeout)
         try:
             response = await self.client.request(method, url, **kwargs)
             return response
         except Exception as e:
-            logger.error(f"HTTP request failed: {e}")
+            logger.error("HTTP request failed: %s", e)
             raise
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the shared HTTP client."""
+        await close_http_client()
 
     @abstractmethod
     async def fetch_data(self, **kwargs):
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
-from app.domain.entities.log_entry import LogEntry
+from app.domain.entities.log_entry import LogEntry, validate_log_batch
 from app.infrastructure.datadog.base_client import BaseDatadogClient
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,7 @@ class DatadogLogsClient(BaseDatadogClient):
         """Fetch logs from Datadog API with fallback to mock data."""
         if not self._is_api_available():
             logger.warning("Datadog API keys not available, using mock data")
-            return self._get_mock_logs(level)
+            return self._get_mock_logs(level, limit)
 
         query = self._build_query(level)
         effective_limit = limit or self._default_limit
@@ -35,32 +35,34 @@ class DatadogLogsClient(BaseDatadogClient):
         # For Cequence mode, restrict to smaller limits to ensure single call
         if limit is not None and limit <= 10:
             logger.info(
-                f"🔧 CEQUENCE MODE: Restricting logs query to {limit} entries for single call"
+                "🔧 CEQUENCE MODE: Restricting logs query to %s entries for single call",
+                limit,
             )
             effective_limit = limit
 
         payload = self._build_payload(query, effective_limit)
 
         try:
-            logger.info(f"Fetching logs from Datadog with query: {query}")
+            logger.info("Fetching logs from Datadog with query: %s", query)
 
             response = await self._make_request(
                 "POST", self._base_url, headers=self._get_headers(), json=payload
             )
 
             if response.status_code == 200:
-                return self._handle_success_response(response, level)
+                return self._handle_success_response(response, level, limit)
             else:
                 logger.warning(
-                    f"Datadog API error {response.status_code}, falling back to mock data"
+                    "Datadog API error %s, falling back to mock data",
+                    response.status_code,
                 )
-                return self._get_mock_logs(level)
+                return self._get_mock_logs(level, limit)
 
         except Exception as e:
             logger.error(
-                f"Error fetching logs from Datadog: {e}, falling back to mock data"
+                "Error fetching logs from Datadog: %s, falling back to mock data", e
             )
-            return self._get_mock_logs(level)
+            return self._get_mock_logs(level, limit)
 
     def _build_query(self, level: Optional[str] = None) -> str:
         """Build Datadog query string."""
@@ -83,7 +85,10 @@ class DatadogLogsClient(BaseDatadogClient):
         }
 
     def _handle_success_response(
-        self, response: httpx.Response, level: Optional[str]
+        self,
+        response: httpx.Response,
+        level: Optional[str],
+        limit: Optional[int] = None,
     ) -> List[LogEntry]:
         """Handle successful API response."""
         data = response.json()
@@ -92,29 +97,32 @@ class DatadogLogsClient(BaseDatadogClient):
         if logs_data:
             log_entries = self._transform_logs(logs_data)
             logger.info(
-                f"✅ Successfully fetched {len(log_entries)} real logs from Datadog"
+                "✅ Successfully fetched %s real logs from Datadog", len(log_entries)
             )
             return log_entries
         else:
             logger.info(
-                f"ℹ️  No logs found in Datadog for service '{self._service_name}' in the last 7 days"
+                "ℹ️  No logs found in Datadog for service '%s' in the last 7 days",
+                self._service_name,
             )
             logger.info(
                 "💡 This is normal if no applications are sending logs to Datadog yet"
             )
             logger.info("🔄 Falling back to mock data for demonstration")
-            return self._get_mock_logs(level)
+            return self._get_mock_logs(level, limit)
 
     def _transform_logs(self, datadog_logs: List[Dict[str, Any]]) -> List[LogEntry]:
         """Transform Datadog logs to LogEntry entities."""
-        entries = []
+        rows = []
+        # Fallback for entries without a timestamp, computed once per batch
+        now = datetime.now(timezone.utc)
 
         for log_data in datadog_logs:
             try:
                 attrs = log_data.get("attributes", {})
 
                 # Parse timestamp
-                timestamp = self._parse_timestamp(attrs.get("timestamp"))
+                timestamp = self._parse_timestamp(attrs.get("timestamp"), now)
 
                 # Extract and normalize level
                 level = self._normalize_level(attrs.get("level", "INFO"))
@@ -122,21 +130,23 @@ class DatadogLogsClient(BaseDatadogClient):
                 # Extract message
                 message = attrs.get("message", "")
 
-                entries.append(
-                    LogEntry(timestamp=timestamp, level=level, message=message)
+                rows.append(
+                    {"timestamp": timestamp, "level": level, "message": message}
                 )
 
             except Exception as e:
-                logger.warning(f"Failed to parse log entry: {e}")
+                logger.warning("Failed to parse log entry: %s", e)
                 continue
 
-        return entries
+        return validate_log_batch(rows)
 
-    def _parse_timestamp(self, timestamp_str: Optional[str]) -> datetime:
-        """Parse timestamp string to datetime object."""
+    def _parse_timestamp(
+        self, timestamp_str: Optional[str], default: Optional[datetime] = None
+    ) -> datetime:
+        """Parse timestamp string to datetime object, or return the default."""
         if timestamp_str:
             return datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        return datetime.now(timezone.utc)
+        return default if default is not None else datetime.now(timezone.utc)
 
     def _normalize_level(self, level: str) -> str:
         """Normalize log level to standard format."""
@@ -147,7 +157,9 @@ class DatadogLogsClient(BaseDatadogClient):
             return "INFO"
         return level
 
-    def _get_mock_logs(self, level: Optional[str] = None) -> List[LogEntry]:
+    def _get_mock_logs(
+        self, level: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[LogEntry]:
         """Generate mock logs when Datadog is unavailable."""
         mock_entries = [
             {
@@ -181,18 +193,22 @@ class DatadogLogsClient(BaseDatadogClient):
             {"level": "INFO", "message": "Cache hit for user session - user_id=67890"},
         ]
 
-        logs = []
+        rows = []
+        now = datetime.now(timezone.utc)
         for i, entry in enumerate(mock_entries):
+            if limit and len(rows) >= limit:
+                break
+
             # Apply level filter if specified
             if level and entry["level"] != level:
                 continue
 
-            logs.append(
-                LogEntry(
-                    timestamp=datetime.now(timezone.utc) - timedelta(minutes=i * 5),
-                    level=entry["level"],
-                    message=f"MOCK: {entry['message']}",
-                )
+            rows.append(
+                {
+                    "timestamp": now - timedelta(minutes=i * 5),
+                    "level": entry["level"],
+                    "message": f"MOCK: {entry['message']}",
+                }
             )
 
-        return logs
+        return validate_log_batch(rows)
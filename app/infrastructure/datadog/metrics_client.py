@@ -7,7 +7,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
-from app.domain.entities.metric import Metric
+from app.domain.entities.metric import Metric, validate_metric_batch
 from app.infrastructure.datadog.base_client import BaseDatadogClient
 
 logger = logging.getLogger(__name__)
@@ -53,7 +53,8 @@ class DatadogMetricsClient(BaseDatadogClient):
         # Check cache first (only for non-historical requests)
         if not fetch_historical and self._is_cache_valid():
             logger.info(
-                f"🚀 CACHE HIT: Returning cached metrics (age: {datetime.now(timezone.utc) - self._cache_timestamp})"
+                "🚀 CACHE HIT: Returning cached metrics (age: %s)",
+                datetime.now(timezone.utc) - self._cache_timestamp,
             )
             return self._cache
 
@@ -61,7 +62,7 @@ class DatadogMetricsClient(BaseDatadogClient):
             return await self._fetch_metrics_from_api(fetch_historical, limit)
         except Exception as e:
             logger.error(
-                f"Error fetching metrics from Datadog: {e}, falling back to mock data"
+                "Error fetching metrics from Datadog: %s, falling back to mock data", e
             )
             return self._get_mock_metrics()
 
@@ -89,16 +90,17 @@ class DatadogMetricsClient(BaseDatadogClient):
             logger.info(
                 "🔧 CEQUENCE MODE: Fetching SINGLE metric to avoid gateway breaking batch calls"
             )
-            logger.info(f"🔍 Single query: {query}")
+            logger.info("🔍 Single query: %s", query)
         else:
             # Normal batch query for direct mode
             query = self._build_batch_query()
             logger.info(
-                f"🚀 OPTIMIZED: Fetching {len(self._metrics_config)} metrics from Datadog in a SINGLE batch call (7-day range)"
+                "🚀 OPTIMIZED: Fetching %s metrics from Datadog in a SINGLE batch call (7-day range)",
+                len(self._metrics_config),
             )
-            logger.info(f"🔍 Batch query: {query}")
+            logger.info("🔍 Batch query: %s", query)
 
-        logger.info(f"⏰ Time range: {time_range[0]} to {time_range[1]} (7 days)")
+        logger.info("⏰ Time range: %s to %s (7 days)", time_range[0], time_range[1])
 
         params = {"query": query, "from": str(time_range[0]), "to": str(time_range[1])}
 
@@ -113,7 +115,7 @@ class DatadogMetricsClient(BaseDatadogClient):
             return self._handle_success_response(response, fetch_historical, limit)
         else:
             logger.warning(
-                f"Datadog API error {response.status_code}, falling back to mock data"
+                "Datadog API error %s, falling back to mock data", response.status_code
             )
             return self._get_mock_metrics()
 
@@ -150,19 +152,22 @@ class DatadogMetricsClient(BaseDatadogClient):
             # If limit is specified (Cequence mode), return only the requested number
             if limit is not None and limit <= 1:
                 logger.info(
-                    f"✅ CEQUENCE MODE: Successfully fetched {len(all_metrics)} metric(s) from Datadog in 1 API call"
+                    "✅ CEQUENCE MODE: Successfully fetched %s metric(s) from Datadog in 1 API call",
+                    len(all_metrics),
                 )
                 return all_metrics[:limit] if all_metrics else all_metrics
             else:
                 logger.info(
-                    f"✅ Successfully fetched {len(all_metrics)} real metrics from Datadog in 1 API call (7-day range)"
+                    "✅ Successfully fetched %s real metrics from Datadog in 1 API call (7-day range)",
+                    len(all_metrics),
                 )
 
                 # Update cache for non-historical requests
                 if not fetch_historical:
                     all_metrics = self._deduplicate_latest_metrics(all_metrics)
                     logger.info(
-                        f"📊 Deduplicated to {len(all_metrics)} latest metrics (one per type)"
+                        "📊 Deduplicated to %s latest metrics (one per type)",
+                        len(all_metrics),
                     )
                     self._update_cache(all_metrics)
 
@@ -200,7 +205,7 @@ class DatadogMetricsClient(BaseDatadogClient):
         fetch_historical: bool = False,
     ) -> List[Metric]:
         """Transform Datadog series to Metric entities."""
-        metrics = []
+        rows = []
 
         for s in series:
             pointlist = s.get("pointlist", [])
@@ -217,10 +222,13 @@ class DatadogMetricsClient(BaseDatadogClient):
                         )
                         value = float(point[1])
 
-                        metrics.append(
-                            Metric(
-                                timestamp=timestamp, name=name, value=value, unit=unit
-                            )
+                        rows.append(
+                            {
+                                "timestamp": timestamp,
+                                "name": name,
+                                "value": value,
+                                "unit": unit,
+                            }
                         )
             else:
                 # Return only the latest (most recent) data point
@@ -231,11 +239,16 @@ class DatadogMetricsClient(BaseDatadogClient):
                     )
                     value = float(latest_point[1])
 
-                    metrics.append(
-                        Metric(timestamp=timestamp, name=name, value=value, unit=unit)
+                    rows.append(
+                        {
+                            "timestamp": timestamp,
+                            "name": name,
+                            "value": value,
+                            "unit": unit,
+                        }
                     )
 
-        return metrics
+        return validate_metric_batch(rows)
 
     def _deduplicate_latest_metrics(self, metrics: List[Metric]) -> List[Metric]:
         """Keep only the latest (most recent) metric for each metric name."""
@@ -262,23 +275,23 @@ class DatadogMetricsClient(BaseDatadogClient):
 
     def _get_mock_metrics(self) -> List[Metric]:
         """Generate mock metrics when Datadog is unavailable."""
-        mock_metrics = []
+        rows = []
         now = datetime.now(timezone.utc)
 
         # Generate ONE mock data point per metric type (latest value only)
         for metric_name, unit in self._metrics_config:
             value = self._generate_mock_value(metric_name, unit)
 
-            mock_metrics.append(
-                Metric(
-                    timestamp=now,  # All use current timestamp as "latest"
-                    name=metric_name,
-                    value=value,
-                    unit=unit,
-                )
+            rows.append(
+                {
+                    "timestamp": now,  # All use current timestamp as "latest"
+                    "name": metric_name,
+                    "value": value,
+                    "unit": unit,
+                }
             )
 
-        return mock_metrics
+        return validate_metric_batch(rows)
 
     def _generate_mock_value(self, metric_name: str, unit: str) -> float:
         """Generate realistic mock value based on metric type."""
@@ -6,14 +6,15 @@ through the Cequence Gateway for audit and monitoring.
 """
 
 import asyncio
-import json
 import logging
 from typing import Any, Dict, Optional
 
 from app.infrastructure.cequence.cequence_client import cequence_client
+from app.infrastructure.cequence.mcp_response import parse_mcp_gateway_response
 from app.infrastructure.gateway.gateway_router import GatewayRouter
 from app.schemas.auth import UserPrincipal
-from app.utils.dummy_data import DummyDataGenerator
+from app.utils.dummy_data import dummy_generator
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -27,8 +28,10 @@ class CequenceRouter(GatewayRouter):
     """
 
     def __init__(self):
-        """Initialize the Cequence router with dummy data generator."""
-        self.dummy_generator = DummyDataGenerator()
+        """Initialize the Cequence router with the shared dummy data generator."""
+        self.dummy_generator = dummy_generator
+        # A burst of identical reads from one caller starts one background fetch
+        self._background_reads = SingleFlight(ttl=0)
 
     async def get_logs(
         self,
@@ -54,8 +57,11 @@ class CequenceRouter(GatewayRouter):
 
         # Start the real API call in background (fire and forget for now)
         asyncio.create_task(
-            cequence_client.get_logs(
-                headers=headers, level=level, limit=limit, since=since
+            self._background_reads.run(
+                ("logs", level, limit, since, headers.get("authorization")),
+                lambda: cequence_client.get_logs(
+                    headers=headers, level=level, limit=limit, since=since
+                ),
             )
         )
 
@@ -92,7 +98,12 @@ class CequenceRouter(GatewayRouter):
 
         # Start the real API call in background (fire and forget for now)
         asyncio.create_task(
-            cequence_client.get_metrics(headers=headers, limit=limit, service=service)
+            self._background_reads.run(
+                ("metrics", limit, service, headers.get("authorization")),
+                lambda: cequence_client.get_metrics(
+                    headers=headers, limit=limit, service=service
+                ),
+            )
         )
 
         return {
@@ -130,9 +141,9 @@ class CequenceRouter(GatewayRouter):
                 environment=environment,
             )
             await self._handle_gateway_error(response, "deploy_service")
-            return await self._parse_mcp_response(response)
+            return parse_mcp_gateway_response(response)
         except Exception as e:
-            logger.error(f"❌ Error routing through Cequence: {e}")
+            logger.error("❌ Error routing through Cequence: %s", e)
             raise
 
     async def rollback_deployment(
@@ -169,9 +180,9 @@ class CequenceRouter(GatewayRouter):
                 environment=environment,
             )
             await self._handle_gateway_error(response, "rollback_deployment")
-            return await self._parse_mcp_response(response)
+            return parse_mcp_gateway_response(response)
         except Exception as e:
-            logger.error(f"❌ Error routing through Cequence: {e}")
+            logger.error("❌ Error routing through Cequence: %s", e)
             raise
 
     async def authenticate_user(
@@ -187,16 +198,14 @@ class CequenceRouter(GatewayRouter):
         # This tool is handled directly by the MCP server without Cequence Gateway routing
         # But we still go through the gateway for consistency
         try:
-            from app.infrastructure.auth.descope_client import descope_client
-
-            # Validate session with Descope
-            jwt_response = descope_client.validate_session(
-                session_token=session_token, refresh_token=refresh_token
+            from app.infrastructure.auth.descope_client import (
+                DescopeAuthError,
+                descope_client,
             )
 
-            # Extract user principal
-            user_principal = descope_client.extract_user_principal(
-                jwt_response, session_token
+            # Validate session and extract the user principal
+            user_principal = await descope_client.aget_user_principal(
+                session_token=session_token, refresh_token=refresh_token
             )
 
             return {
@@ -211,54 +220,19 @@ class CequenceRouter(GatewayRouter):
                     "tenant": user_principal.tenant,
                 },
             }
-        except Exception as e:
+        except DescopeAuthError as e:
             return {
                 "tool": "authenticate_user",
                 "success": False,
-                "error": f"Authentication failed: {str(e)}",
+                "error": f"Authentication failed: {e.detail}",
             }
 
-    async def _parse_mcp_response(self, response) -> Dict[str, Any]:
-        """Parse MCP response from Cequence Gateway, handling both SSE and JSON formats."""
-        try:
-            # Handle SSE format if present
-            if response.headers.get("content-type", "").startswith("text/event-stream"):
-                # Parse SSE format: "data: {json}\n\n"
-                for line in response.text.split("\n"):
-                    if line.startswith("data: "):
-                        mcp_response = json.loads(line[6:])  # Remove 'data: ' prefix
-                        if "result" in mcp_response:
-                            return mcp_response["result"]
-                        elif "error" in mcp_response:
-                            logger.warning(
-                                f"⚠️ MCP error from gateway: {mcp_response['error']}"
-                            )
-                            raise Exception(
-                                f"Gateway returned error: {mcp_response['error']['message']}"
-                            )
-                raise Exception("No valid data found in SSE response")
-            else:
-                # Handle regular JSON response
-                mcp_response = response.json()
-                if "result" in mcp_response:
-                    return mcp_response["result"]
-                elif "error" in mcp_response:
-                    logger.warning(f"⚠️ MCP error from gateway: {mcp_response['error']}")
-                    raise Exception(
-                        f"Gateway returned error: {mcp_response['error']['message']}"
-                    )
-                else:
-                    logger.warning(f"⚠️ Unexpected MCP response format: {mcp_response}")
-                    raise Exception("Unexpected response format from gateway")
-        except (ValueError, json.JSONDecodeError) as e:
-            logger.warning(f"⚠️ Failed to parse Cequence response: {e}")
-            logger.debug(f"Response content: {response.text[:500]}")
-            raise Exception("Invalid response from gateway")
-
     async def _handle_gateway_error(self, response, operation: str) -> None:
         """Handle Cequence Gateway errors with fallback logging."""
         if response.status_code >= 400:
             logger.warning(
-                f"⚠️ Cequence Gateway returned {response.status_code} for {operation}, falling back to direct mode"
+                "⚠️ Cequence Gateway returned %s for %s, falling back to direct mode",
+                response.status_code,
+                operation,
             )
             raise Exception(f"Gateway error: {response.status_code}")
@@ -6,18 +6,20 @@ without going through any external gateway.
 """
 
 import logging
-from datetime import datetime
 from typing import Any, Dict, Optional
 
+from app.config import settings
 from app.domain.services.deploy_service import DeployService
 from app.domain.services.log_service import LogService
 from app.domain.services.metrics_service import MetricsService
 from app.domain.services.rollback_service import RollbackService
-from app.infrastructure.auth.descope_client import descope_client
+from app.infrastructure.auth.descope_client import DescopeAuthError, descope_client
 from app.infrastructure.cicd.cicd_client import CICDClient
 from app.infrastructure.gateway.gateway_router import GatewayRouter
 from app.infrastructure.rollback.rollback_client import RollbackClient
 from app.schemas.auth import UserPrincipal
+from app.schemas.mcp.fast import LogEntryS, MetricEntryS
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +38,10 @@ class DirectRouter(GatewayRouter):
         self.metrics_service = MetricsService()
         self.deploy_service = DeployService(CICDClient())
         self.rollback_service = RollbackService(RollbackClient())
+        # Identical log/metric reads share one service call and its result for
+        # RESOURCE_CACHE_TTL seconds. The data does not depend on the caller, and
+        # permissions are checked before the lookup, so keys carry filters only
+        self._shared_reads = SingleFlight(ttl=settings.RESOURCE_CACHE_TTL)
 
     async def get_logs(
         self,
@@ -52,30 +58,26 @@ class DirectRouter(GatewayRouter):
         self.check_permission(user, "read_logs", "read logs")
 
         try:
-            logs = await self.log_service.get_recent_logs(
-                user_permissions=user.permissions, level=level, limit=limit
+            logs = await self._shared_reads.run(
+                ("logs", level, limit),
+                lambda: self.log_service.get_recent_logs(
+                    user_permissions=user.permissions, level=level, limit=limit
+                ),
             )
 
-            # Apply limit
-            logs = logs[:limit]
-
             return {
                 "uri": "logs",
                 "type": "logs",
                 "count": len(logs),
                 "filters": {"level": level, "limit": limit},
+                # Build the response structs directly; no intermediate dicts
                 "data": [
-                    {
-                        "level": log.level,
-                        "message": log.message,
-                        "timestamp": log.timestamp,
-                        "source": getattr(log, "source", "system"),
-                    }
+                    LogEntryS(log.level, log.message, log.timestamp, log.source)
                     for log in logs
                 ],
             }
         except Exception as e:
-            logger.error(f"❌ Error reading logs: {e}")
+            logger.error("❌ Error reading logs: %s", e)
             from fastapi import HTTPException
 
             raise HTTPException(status_code=500, detail=str(e))
@@ -94,32 +96,27 @@ class DirectRouter(GatewayRouter):
         self.check_permission(user, "read_metrics", "read metrics")
 
         try:
-            metrics = await self.metrics_service.get_recent_metrics(
-                user_permissions=user.permissions, limit=limit
+            metrics = await self._shared_reads.run(
+                ("metrics", limit),
+                lambda: self.metrics_service.get_recent_metrics(
+                    user_permissions=user.permissions, limit=limit
+                ),
             )
 
-            # Apply limit
-            metrics = metrics[:limit]
-
             return {
                 "uri": "metrics",
                 "type": "metrics",
                 "count": len(metrics),
                 "filters": {"limit": limit},
                 "data": [
-                    {
-                        "name": metric.name,
-                        "value": metric.value,
-                        "unit": metric.unit,
-                        "timestamp": getattr(
-                            metric, "timestamp", datetime.now().isoformat()
-                        ),
-                    }
+                    MetricEntryS(
+                        metric.name, metric.value, metric.unit, metric.timestamp
+                    )
                     for metric in metrics
                 ],
             }
         except Exception as e:
-            logger.error(f"❌ Error reading metrics: {e}")
+            logger.error("❌ Error reading metrics: %s", e)
             from fastapi import HTTPException
 
             raise HTTPException(status_code=500, detail=str(e))
@@ -149,7 +146,7 @@ class DirectRouter(GatewayRouter):
 
             return {"tool": "deploy_service", "success": True, "result": json_response}
         except Exception as e:
-            logger.error(f"❌ Error executing deploy_service: {e}")
+            logger.error("❌ Error executing deploy_service: %s", e)
             return {"tool": "deploy_service", "success": False, "error": str(e)}
 
     async def rollback_deployment(
@@ -190,7 +187,7 @@ class DirectRouter(GatewayRouter):
                 "result": json_response,
             }
         except Exception as e:
-            logger.error(f"❌ Error executing rollback_deployment: {e}")
+            logger.error("❌ Error executing rollback_deployment: %s", e)
             return {"tool": "rollback_deployment", "success": False, "error": str(e)}
 
     async def authenticate_user(
@@ -204,16 +201,11 @@ class DirectRouter(GatewayRouter):
         logger.info("🔧 Authenticate user (direct mode)")
 
         try:
-            # Validate session with Descope
-            jwt_response = descope_client.validate_session(
+            # Validate session and extract the user principal
+            user_principal = await descope_client.aget_user_principal(
                 session_token=session_token, refresh_token=refresh_token
             )
 
-            # Extract user principal
-            user_principal = descope_client.extract_user_principal(
-                jwt_response, session_token
-            )
-
             return {
                 "tool": "authenticate_user",
                 "success": True,
@@ -226,9 +218,9 @@ class DirectRouter(GatewayRouter):
                     "tenant": user_principal.tenant,
                 },
             }
-        except Exception as e:
+        except DescopeAuthError as e:
             return {
                 "tool": "authenticate_user",
                 "success": False,
-                "error": f"Authentication failed: {str(e)}",
+                "error": f"Authentication failed: {e.detail}",
             }
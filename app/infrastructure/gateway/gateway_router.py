@@ -154,7 +154,7 @@ class GatewayRouter(ABC):
         """
         from fastapi import HTTPException
 
-        if permission not in user.permissions:
+        if permission not in user.permission_set:
             detail = f"Insufficient permissions to {resource or permission}"
             raise HTTPException(status_code=403, detail=detail)
 
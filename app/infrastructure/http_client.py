@@ -0,0 +1,47 @@
+"""Shared HTTP client for outbound calls (Datadog API, Cequence Gateway)."""
+
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One pool for every infrastructure client, so connections are reused
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+# Fail fast on unreachable hosts so gateway calls can fall back to direct mode
+CONNECT_TIMEOUT = 5.0
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=CONNECT_TIMEOUT)
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared pooled HTTP client, creating it on first use.
+
+    Returns:
+        The process-wide httpx.AsyncClient
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT, limits=HTTP_LIMITS, http2=HTTP2_AVAILABLE
+        )
+        logger.info("🌐 Shared HTTP client created (http2=%s)", HTTP2_AVAILABLE)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
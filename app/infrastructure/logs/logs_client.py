@@ -1,18 +1,29 @@
 import random
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from app.domain.entities.log_entry import LogEntry
 
 
 class LogsClient:
-    async def fetch_logs(self) -> list[LogEntry]:
+    async def fetch_logs(
+        self, level: Optional[str] = None, limit: Optional[int] = None
+    ) -> list[LogEntry]:
         levels = ["INFO", "WARNING", "ERROR"]
         now = datetime.now(timezone.utc)
-        return [
-            LogEntry(
-                timestamp=now - timedelta(minutes=i),
-                level=random.choice(levels),
-                message=f"Mock log message {i}",
+        logs = []
+        for i in range(5):
+            if limit and len(logs) >= limit:
+                break
+            log_level = random.choice(levels)
+            # Apply the level filter while generating instead of afterwards
+            if level and log_level != level:
+                continue
+            logs.append(
+                LogEntry(
+                    timestamp=now - timedelta(minutes=i),
+                    level=log_level,
+                    message=f"Mock log message {i}",
+                )
             )
-            for i in range(5)
-        ]
+        return logs
@@ -1,13 +1,15 @@
 import random
 from datetime import datetime, timedelta, timezone
+from typing import Optional
 
 from app.domain.entities.metric import Metric
 
 
 class MetricsClient:
-    async def fetch_metrics(self) -> list[Metric]:
+    async def fetch_metrics(self, limit: Optional[int] = None) -> list[Metric]:
         metrics = ["cpu_usage", "memory_usage", "disk_usage", "network_io"]
         now = datetime.now(timezone.utc)
+        count = min(5, limit) if limit else 5
         return [
             Metric(
                 timestamp=now - timedelta(minutes=i),
@@ -15,5 +17,5 @@ class MetricsClient:
                 value=round(random.uniform(0, 100), 2),
                 unit="percent",
             )
-            for i in range(5)
+            for i in range(count)
         ]
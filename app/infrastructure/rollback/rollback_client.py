@@ -1,5 +1,6 @@
 import random
 import uuid
+from dataclasses import asdict
 from datetime import datetime, timezone
 from typing import Any, Dict, Tuple
 
@@ -82,7 +83,7 @@ class RollbackClient:
         # Create JSON response
         json_response = {
             "success": status in ["SUCCESS", "IN_PROGRESS"],
-            "rollback": rollback.dict(),
+            "rollback": asdict(rollback),
             "message": self._get_rollback_message(status, deployment_id, environment),
             "metadata": {
                 "rollback_id": rollback_id,
@@ -204,7 +205,7 @@ class RollbackClient:
         # Create JSON response
         json_response = {
             "success": True,
-            "rollbacks": [rollback.dict() for rollback in sorted_rollbacks],
+            "rollbacks": [asdict(rollback) for rollback in sorted_rollbacks],
             "count": len(sorted_rollbacks),
             "message": f"Retrieved {len(sorted_rollbacks)} recent rollbacks",
             "metadata": {
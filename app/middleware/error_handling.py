@@ -80,7 +80,11 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
         """
         # Log the error
         logger.warning(
-            f"🚨 HTTP {exc.status_code} error for {request.method} {request.url.path}: {exc.detail}"
+            "🚨 HTTP %s error for %s %s: %s",
+            exc.status_code,
+            request.method,
+            request.url.path,
+            exc.detail,
         )
 
         # Create error response
@@ -97,7 +101,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
 
         return JSONResponse(
             status_code=exc.status_code,
-            content=error_response.dict(),
+            content=error_response.model_dump(mode="json"),
             headers={"Content-Type": "application/json"},
         )
 
@@ -116,11 +120,11 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
         """
         # Log the error with full traceback
         logger.error(
-            f"💥 Unexpected error for {request.method} {request.url.path}: {str(exc)}"
+            "💥 Unexpected error for %s %s: %s", request.method, request.url.path, exc
         )
 
         if self.enable_error_logging:
-            logger.error(f"📋 Full traceback:\n{traceback.format_exc()}")
+            logger.error("📋 Full traceback:\n%s", traceback.format_exc())
 
         # Create error response
         error_response = ErrorResponse(
@@ -136,7 +140,7 @@ class ErrorHandlingMiddleware(BaseHTTPMiddleware):
 
         return JSONResponse(
             status_code=500,
-            content=error_response.dict(),
+            content=error_response.model_dump(mode="json"),
             headers={"Content-Type": "application/json"},
         )
 
@@ -38,7 +38,7 @@ class GatewayRoutingMiddleware(BaseHTTPMiddleware):
         self.router_factory = RouterFactory()
         self.router_type = self.router_factory.get_router_type()
 
-        logger.info(f"🌐 Gateway routing middleware initialized: {self.router_type}")
+        logger.info("🌐 Gateway routing middleware initialized: %s", self.router_type)
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """
@@ -61,7 +61,10 @@ class GatewayRoutingMiddleware(BaseHTTPMiddleware):
 
         # Log routing decision
         logger.debug(
-            f"🔀 Routing request {request.method} {request.url.path} through {self.router_type}"
+            "🔀 Routing request %s %s through %s",
+            request.method,
+            request.url.path,
+            self.router_type,
         )
 
         try:
@@ -78,7 +81,10 @@ class GatewayRoutingMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             # Log gateway routing errors
             logger.error(
-                f"❌ Gateway routing error for {request.method} {request.url.path}: {e}"
+                "❌ Gateway routing error for %s %s: %s",
+                request.method,
+                request.url.path,
+                e,
             )
 
             # If Cequence fails, we could potentially retry with direct mode
@@ -59,11 +59,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
         # Log incoming request
         logger.info(
-            f"📥 {request.method} {request.url.path} - {request_info['client_ip']}"
+            "📥 %s %s - %s", request.method, request.url.path, request_info["client_ip"]
         )
 
-        if self.enable_detailed_logging:
-            logger.debug(f"📋 Request details: {json.dumps(request_info, indent=2)}")
+        if self.enable_detailed_logging and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 Request details: %s", json.dumps(request_info, indent=2))
 
         try:
             # Process request
@@ -77,13 +77,16 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
             # Log outgoing response
             logger.info(
-                f"📤 {request.method} {request.url.path} - {response.status_code} - "
-                f"{process_time:.3f}s"
+                "📤 %s %s - %s - %.3fs",
+                request.method,
+                request.url.path,
+                response.status_code,
+                process_time,
             )
 
-            if self.enable_detailed_logging:
+            if self.enable_detailed_logging and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(
-                    f"📋 Response details: {json.dumps(response_info, indent=2)}"
+                    "📋 Response details: %s", json.dumps(response_info, indent=2)
                 )
 
             # Add performance headers
@@ -98,7 +101,11 @@ class LoggingMiddleware(BaseHTTPMiddleware):
 
             # Log error
             logger.error(
-                f"💥 {request.method} {request.url.path} - ERROR - {process_time:.3f}s - {str(e)}"
+                "💥 %s %s - ERROR - %.3fs - %s",
+                request.method,
+                request.url.path,
+                process_time,
+                e,
             )
 
             # Re-raise the exception for error handling middleware
@@ -142,7 +149,7 @@ class LoggingMiddleware(BaseHTTPMiddleware):
                     if body:
                         info["body"] = body.decode("utf-8")
             except Exception as e:
-                logger.warning(f"⚠️ Could not log request body: {e}")
+                logger.warning("⚠️ Could not log request body: %s", e)
 
         return info
 
@@ -99,7 +99,7 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
             raise
         except Exception as e:
             # Handle validation errors
-            logger.warning(f"⚠️ Request validation failed: {e}")
+            logger.warning("⚠️ Request validation failed: %s", e)
             return await self._create_validation_error_response(str(e))
 
     async def _validate_request_size(self, request: Request) -> None:
@@ -135,12 +135,12 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
         required_headers = ["user-agent"]
         for header in required_headers:
             if header not in request.headers:
-                logger.warning(f"⚠️ Missing required header: {header}")
+                logger.warning("⚠️ Missing required header: %s", header)
 
         # Check for suspicious header values
         for name, value in request.headers.items():
             if self._contains_suspicious_content(value):
-                logger.warning(f"⚠️ Suspicious content in header {name}: {value}")
+                logger.warning("⚠️ Suspicious content in header %s: %s", name, value)
                 raise HTTPException(
                     status_code=400, detail="Invalid header content detected"
                 )
@@ -158,7 +158,9 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
         for name, value in request.query_params.items():
             # Check for suspicious content
             if self._contains_suspicious_content(value):
-                logger.warning(f"⚠️ Suspicious content in query param {name}: {value}")
+                logger.warning(
+                    "⚠️ Suspicious content in query param %s: %s", name, value
+                )
                 raise HTTPException(
                     status_code=400, detail="Invalid query parameter content detected"
                 )
@@ -167,7 +169,7 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
             try:
                 unquote(value)
             except Exception as e:
-                logger.warning(f"⚠️ Invalid URL encoding in query param {name}: {e}")
+                logger.warning("⚠️ Invalid URL encoding in query param %s: %s", name, e)
                 raise HTTPException(
                     status_code=400, detail="Invalid URL encoding detected"
                 )
@@ -198,10 +200,10 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
                     self._validate_json_content(json_data)
 
             except json.JSONDecodeError as e:
-                logger.warning(f"⚠️ Invalid JSON in request body: {e}")
+                logger.warning("⚠️ Invalid JSON in request body: %s", e)
                 raise HTTPException(status_code=400, detail="Invalid JSON format")
             except Exception as e:
-                logger.warning(f"⚠️ Error validating request body: {e}")
+                logger.warning("⚠️ Error validating request body: %s", e)
                 raise HTTPException(status_code=400, detail="Invalid request body")
 
     def _validate_url_path(self, request: Request) -> None:
@@ -218,12 +220,12 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
 
         # Check for suspicious content in path
         if self._contains_suspicious_content(path):
-            logger.warning(f"⚠️ Suspicious content in URL path: {path}")
+            logger.warning("⚠️ Suspicious content in URL path: %s", path)
             raise HTTPException(status_code=400, detail="Invalid URL path detected")
 
         # Check for path traversal attempts
         if ".." in path or "//" in path:
-            logger.warning(f"⚠️ Path traversal attempt detected: {path}")
+            logger.warning("⚠️ Path traversal attempt detected: %s", path)
             raise HTTPException(status_code=400, detail="Invalid URL path detected")
 
     def _validate_json_structure(
@@ -331,6 +333,6 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
 
         return JSONResponse(
             status_code=400,
-            content=error_response.dict(),
+            content=error_response.model_dump(mode="json"),
             headers={"Content-Type": "application/json"},
         )
@@ -7,16 +7,17 @@ Handles:
 - Server status and capabilities
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+
+from app.schemas.mcp.fast import encode_json
 
 # Create router
 router = APIRouter(tags=["health"])
 
 
-@router.get("/")
-async def root():
-    """Root endpoint with server information."""
-    return {
+# Root payload is static, so encode it once and let clients cache it
+_ROOT_BODY = encode_json(
+    {
         "name": "DevOps MCP HTTP Server",
         "version": "1.0.0",
         "protocol": "MCP over HTTP",
@@ -37,13 +38,28 @@ async def root():
         },
         "endpoints": {"resources": "/mcp/resources", "tools": "/mcp/tools"},
     }
+)
+_ROOT_HEADERS = {"Cache-Control": "public, max-age=60"}
 
 
-@router.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
+@router.get("/")
+async def root():
+    """Root endpoint with server information."""
+    return Response(
+        content=_ROOT_BODY, media_type="application/json", headers=_ROOT_HEADERS
+    )
+
+
+_HEALTH_BODY = encode_json(
+    {
         "status": "healthy",
         "service": "devops-mcp-server",
         "version": "1.0.0",
     }
+)
+
+
+@router.get("/health")
+async def health_check():
+    """Health check endpoint."""
+    return Response(content=_HEALTH_BODY, media_type="application/json")
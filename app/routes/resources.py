@@ -5,26 +5,38 @@ Handles all /mcp/resources/* endpoints including:
 - List resources
 - Get logs
 - Get metrics
-- Read specific resources by path
+- Not-found responses for other resource paths
 """
 
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 
 from app.dependencies import get_current_user
 from app.domain.services.mcp_service import MCPResourceService
+from app.infrastructure.cequence.cequence_client import forwarded_headers
 from app.schemas.auth import UserPrincipal
 from app.schemas.mcp import (
-    LogEntry,
     LogsResourceRequest,
     LogsResponse,
     MCPResourceList,
-    MetricEntry,
     MetricsResourceRequest,
     MetricsResponse,
 )
+from app.schemas.mcp.fast import (
+    STREAM_CHUNK_SIZE,
+    LogsFilterS,
+    LogsResponseS,
+    MetricsFilterS,
+    MetricsResponseS,
+    encode_json,
+    iter_json_chunks,
+    to_log_entries,
+    to_metric_entries,
+)
+from app.schemas.mcp.resources import MCP_RESOURCES
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -36,12 +48,26 @@ router = APIRouter(prefix="/mcp/resources", tags=["resources"])
 mcp_resource_service = MCPResourceService()
 
 
+# The resource list never changes after startup, so serialize it once
+_RESOURCE_LIST_BODY = MCPResourceList.model_construct(
+    resources=MCP_RESOURCES, total=len(MCP_RESOURCES)
+).model_dump_json()
+
+
 @router.get("", response_model=MCPResourceList)
 async def list_resources(user: UserPrincipal = Depends(get_current_user)):
     """List all available MCP resources."""
-    from app.schemas.mcp.resources import MCP_RESOURCES
+    return Response(content=_RESOURCE_LIST_BODY, media_type="application/json")
 
-    return MCPResourceList(resources=MCP_RESOURCES, total=len(MCP_RESOURCES))
+
+def _entries_response(response, entries) -> Response:
+    """Send small results in one body and stream larger ones in chunks."""
+    if len(entries) <= STREAM_CHUNK_SIZE:
+        response.data = entries
+        return Response(content=encode_json(response), media_type="application/json")
+    return StreamingResponse(
+        iter_json_chunks(response, entries), media_type="application/json"
+    )
 
 
 @router.get("/logs", response_model=LogsResponse)
@@ -62,7 +88,7 @@ async def get_logs(
             level=level, limit=limit, since=since, service=service
         )
 
-        headers = dict(request.headers)
+        headers = forwarded_headers(request.headers)
         result = await mcp_resource_service.get_logs(
             headers=headers,
             user=user,
@@ -71,24 +97,25 @@ async def get_logs(
             since=request_data.since,
         )
 
-        # Convert to LogsResponse model
-        return LogsResponse(
+        # Encode with msgspec; LogsResponse only documents the schema
+        response = LogsResponseS(
             success=True,
             uri="logs",
             type="logs",
             count=result.get("count", 0),
-            filters={
-                "level": request_data.level,
-                "limit": request_data.limit,
-                "since": request_data.since,
-                "service": request_data.service,
-            },
-            data=[LogEntry(**log) for log in result.get("data", [])],
+            filters=LogsFilterS(
+                level=request_data.level,
+                limit=request_data.limit,
+                since=request_data.since,
+                service=request_data.service,
+            ),
+            data=[],
             loading=result.get("loading", False),
             message=result.get("message"),
         )
+        return _entries_response(response, to_log_entries(result.get("data", [])))
     except Exception as e:
-        logger.error(f"❌ Error reading logs: {e}")
+        logger.error("❌ Error reading logs: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -110,7 +137,7 @@ async def get_metrics(
             limit=limit, service=service, metric_type=metric_type, time_range=time_range
         )
 
-        headers = dict(request.headers)
+        headers = forwarded_headers(request.headers)
         result = await mcp_resource_service.get_metrics(
             headers=headers,
             user=user,
@@ -118,59 +145,35 @@ async def get_metrics(
             service=request_data.service,
         )
 
-        # Convert to MetricsResponse model
-        return MetricsResponse(
+        # Encode with msgspec; MetricsResponse only documents the schema
+        response = MetricsResponseS(
             success=True,
             uri="metrics",
             type="metrics",
             count=result.get("count", 0),
-            filters={
-                "limit": request_data.limit,
-                "service": request_data.service,
-                "metric_type": request_data.metric_type,
-                "time_range": request_data.time_range,
-            },
-            data=[MetricEntry(**metric) for metric in result.get("data", [])],
+            filters=MetricsFilterS(
+                limit=request_data.limit,
+                service=request_data.service,
+                metric_type=request_data.metric_type,
+                time_range=request_data.time_range,
+            ),
+            data=[],
             loading=result.get("loading", False),
             message=result.get("message"),
         )
+        return _entries_response(response, to_metric_entries(result.get("data", [])))
     except Exception as e:
-        logger.error(f"❌ Error reading metrics: {e}")
+        logger.error("❌ Error reading metrics: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# The /logs and /metrics routes above are registered first and serve those
+# resources (streaming large results), so only unknown paths reach this route.
 @router.get("/{resource_path:path}")
 async def read_resource(
     resource_path: str,
-    request: Request,
-    level: Optional[str] = None,
-    limit: int = 100,
     user: UserPrincipal = Depends(get_current_user),
 ):
-    """Read a specific MCP resource by URI path with optional query parameters."""
-    logger.info(f"📖 Reading resource: {resource_path}")
-
-    try:
-        headers = dict(request.headers)
-
-        if resource_path == "logs":
-            result = await mcp_resource_service.get_logs(
-                headers=headers, user=user, level=level, limit=limit
-            )
-            result["uri"] = resource_path
-            return result
-        elif resource_path == "metrics":
-            result = await mcp_resource_service.get_metrics(
-                headers=headers, user=user, limit=limit
-            )
-            result["uri"] = resource_path
-            return result
-        else:
-            raise HTTPException(
-                status_code=404, detail=f"Resource not found: {resource_path}"
-            )
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"❌ Error reading resource {resource_path}: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    """Reject MCP resource paths other than the ones served above."""
+    logger.info("📖 Reading resource: %s", resource_path)
+    raise HTTPException(status_code=404, detail=f"Resource not found: {resource_path}")
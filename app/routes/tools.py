@@ -9,25 +9,72 @@ Handles all /mcp/tools/* endpoints including:
 - Various MCP tool endpoints for Cequence Gateway
 """
 
-import json
+import asyncio
 import logging
-from typing import Any, Dict, List
-
-from fastapi import APIRouter, Depends, HTTPException, Request
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+import httpx
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel
 
 from app.config import settings
 from app.dependencies import get_current_user
+from app.domain.entities.log_entry import LOG_LIST_ADAPTER
+from app.domain.entities.metric import METRIC_LIST_ADAPTER
 from app.domain.services.deploy_service import DeployService
 from app.domain.services.log_service import LogService
 from app.domain.services.metrics_service import MetricsService
 from app.domain.services.rollback_service import RollbackService
-from app.infrastructure.auth.descope_client import descope_client
-from app.infrastructure.cequence.cequence_client import cequence_client
+from app.infrastructure.auth.descope_client import (
+    DescopeAuthError,
+    descope_client,
+    session_cache_key,
+)
+from app.infrastructure.cequence.cequence_client import (
+    cequence_client,
+    forwarded_headers,
+)
+from app.infrastructure.cequence.mcp_response import parse_mcp_gateway_response
 from app.infrastructure.cicd.cicd_client import CICDClient
 from app.infrastructure.rollback.rollback_client import RollbackClient
 from app.schemas.auth import UserPrincipal
-from app.utils.dummy_data import DummyDataGenerator
+from app.schemas.mcp.fast import (
+    ArgsStruct,
+    AuthenticateUserArgsS,
+    DeployServiceArgsS,
+    RollbackDeploymentArgsS,
+    convert_tool_arguments,
+    decode_tool_arguments,
+    encode_json,
+    required_fields,
+)
+from app.schemas.mcp.resources import (
+    DEPLOY_ENV_PROP,
+    LEVEL_PROP,
+    LIMIT_50,
+    LIMIT_100,
+    METRIC_TYPE_PROP,
+    REFRESH_TOKEN_PROP,
+    ROLLBACK_ENV_PROP,
+    SERVICE_PROP,
+    SESSION_TOKEN_PROP,
+)
+from app.utils.circuit_breaker import CircuitBreaker
+from app.utils.json_response import FastJSONResponse
+from app.utils.ttl_cache import TTLCache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -40,592 +87,532 @@ log_service = LogService()
 metrics_service = MetricsService()
 deploy_service = DeployService(CICDClient())
 rollback_service = RollbackService(RollbackClient())
-dummy_generator = DummyDataGenerator()
-
-
-# Pydantic models for requests
-class ToolCallRequest(BaseModel):
-    arguments: Dict[str, Any] = {}
-
-
-def check_permission(
-    user: UserPrincipal, permission: str, resource: str = None
-) -> None:
-    """Check if user has required permission, raise HTTPException if not."""
-    if permission not in user.permissions:
-        detail = f"Insufficient permissions to {resource or permission}"
-        raise HTTPException(status_code=403, detail=detail)
-
-
-def validate_tool_arguments(
-    arguments: Dict[str, Any], required_params: List[str]
-) -> None:
-    """Validate that all required parameters are present in tool arguments."""
-    missing = [param for param in required_params if not arguments.get(param)]
-    if missing:
-        raise HTTPException(
-            status_code=400, detail=f"Missing required parameters: {', '.join(missing)}"
-        )
-
-
-async def parse_mcp_response(response) -> Dict[str, Any]:
-    """Parse MCP response from Cequence Gateway, handling both SSE and JSON formats."""
-    try:
-        # Handle SSE format if present
-        if response.headers.get("content-type", "").startswith("text/event-stream"):
-            # Parse SSE format: "data: {json}\n\n"
-            for line in response.text.split("\n"):
-                if line.startswith("data: "):
-                    mcp_response = json.loads(line[6:])  # Remove 'data: ' prefix
-                    if "result" in mcp_response:
-                        return mcp_response["result"]
-                    elif "error" in mcp_response:
-                        logger.warning(
-                            f"⚠️ MCP error from gateway: {mcp_response['error']}"
-                        )
-                        raise Exception(
-                            f"Gateway returned error: {mcp_response['error']['message']}"
-                        )
-            raise Exception("No valid data found in SSE response")
-        else:
-            # Handle regular JSON response
-            mcp_response = response.json()
-            if "result" in mcp_response:
-                return mcp_response["result"]
-            elif "error" in mcp_response:
-                logger.warning(f"⚠️ MCP error from gateway: {mcp_response['error']}")
-                raise Exception(
-                    f"Gateway returned error: {mcp_response['error']['message']}"
-                )
-            else:
-                logger.warning(f"⚠️ Unexpected MCP response format: {mcp_response}")
-                raise Exception("Unexpected response format from gateway")
-    except (ValueError, json.JSONDecodeError) as e:
-        logger.warning(f"⚠️ Failed to parse Cequence response: {e}")
-        logger.debug(f"Response content: {response.text[:500]}")
-        raise Exception("Invalid response from gateway")
-
-
-async def handle_cequence_gateway_error(response, operation: str) -> None:
-    """Handle Cequence Gateway errors with fallback logging."""
-    if response.status_code >= 400:
-        logger.warning(
-            f"⚠️ Cequence Gateway returned {response.status_code} for {operation}, falling back to direct mode"
-        )
-        raise Exception(f"Gateway error: {response.status_code}")
 
 
-@router.get("")
-async def list_tools(user: UserPrincipal = Depends(get_current_user)):
-    """List all available MCP tools."""
-    # MCP Tools definition - Actions only
-    MCP_TOOLS = [
-        {
-            "name": "deploy_service",
-            "description": "Deploy a service to a specific environment",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "service_name": {
-                        "type": "string",
-                        "description": "Name of the service to deploy",
-                    },
-                    "version": {"type": "string", "description": "Version to deploy"},
-                    "environment": {
-                        "type": "string",
-                        "enum": ["development", "staging", "production"],
-                        "description": "Target environment",
-                    },
+# MCP Tools definition - Actions only. Built once at import and shared by the
+# tool listing endpoints, so it must not be mutated.
+TOOL_DEFINITIONS = [
+    {
+        "name": "deploy_service",
+        "description": "Deploy a service to a specific environment",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "service_name": {
+                    "type": "string",
+                    "description": "Name of the service to deploy",
                 },
-                "required": ["service_name", "version", "environment"],
+                "version": {"type": "string", "description": "Version to deploy"},
+                "environment": DEPLOY_ENV_PROP,
             },
+            "required": ["service_name", "version", "environment"],
         },
-        {
-            "name": "rollback_deployment",
-            "description": "Rollback a deployment to previous version",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "deployment_id": {
-                        "type": "string",
-                        "description": "ID of the deployment to rollback",
-                    },
-                    "reason": {
-                        "type": "string",
-                        "description": "Reason for the rollback",
-                    },
-                    "environment": {
-                        "type": "string",
-                        "enum": ["staging", "production"],
-                        "description": "Environment to rollback",
-                    },
+    },
+    {
+        "name": "rollback_deployment",
+        "description": "Rollback a deployment to previous version",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "deployment_id": {
+                    "type": "string",
+                    "description": "ID of the deployment to rollback",
+                },
+                "reason": {
+                    "type": "string",
+                    "description": "Reason for the rollback",
                 },
-                "required": ["deployment_id", "reason", "environment"],
+                "environment": ROLLBACK_ENV_PROP,
             },
+            "required": ["deployment_id", "reason", "environment"],
         },
-        {
-            "name": "authenticate_user",
-            "description": "Authenticate user and get permissions",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "session_token": {
-                        "type": "string",
-                        "description": "Descope session token",
-                    },
-                    "refresh_token": {
-                        "type": "string",
-                        "description": "Descope refresh token (optional)",
-                    },
-                },
-                "required": ["session_token"],
+    },
+    {
+        "name": "authenticate_user",
+        "description": "Authenticate user and get permissions",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "session_token": SESSION_TOKEN_PROP,
+                "refresh_token": REFRESH_TOKEN_PROP,
             },
+            "required": ["session_token"],
         },
-        {
-            "name": "getMcpResourcesLogs",
-            "description": "Get system logs with optional filtering",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "level": {
-                        "type": "string",
-                        "enum": ["DEBUG", "INFO", "WARN", "ERROR"],
-                        "description": "Log level filter",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Limit number of results",
-                    },
-                    "since": {
-                        "type": "string",
-                        "description": "Filter logs since timestamp (ISO format)",
-                    },
+    },
+    {
+        "name": "getMcpResourcesLogs",
+        "description": "Get system logs with optional filtering",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "level": LEVEL_PROP,
+                "limit": LIMIT_100,
+                "since": {
+                    "type": "string",
+                    "description": "Filter logs since timestamp (ISO format)",
                 },
-                "required": [],
             },
+            "required": [],
         },
-        {
-            "name": "getMcpResourcesMetrics",
-            "description": "Get performance metrics with optional filtering",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Limit number of results",
-                    },
-                    "service": {
-                        "type": "string",
-                        "description": "Filter by service name",
-                    },
-                    "metric_type": {
-                        "type": "string",
-                        "description": "Type of metric to retrieve",
-                    },
-                },
-                "required": [],
+    },
+    {
+        "name": "getMcpResourcesMetrics",
+        "description": "Get performance metrics with optional filtering",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "limit": LIMIT_50,
+                "service": SERVICE_PROP,
+                "metric_type": METRIC_TYPE_PROP,
             },
+            "required": [],
         },
-    ]
-
-    return {"tools": MCP_TOOLS}
+    },
+]
+
+# Serialized tool listing, encoded once since TOOL_DEFINITIONS is static
+_TOOL_LIST_BODY = encode_json({"tools": TOOL_DEFINITIONS})
+
+# Static gateway tool results, encoded once like the listing above
+_GET_MCP_RESOURCES_BODY = encode_json(
+    {
+        "tool": "getMcpResources",
+        "success": True,
+        "result": {
+            "resources": [
+                {
+                    "uri": "logs",
+                    "name": "System Logs",
+                    "description": "Application and system logs with filtering capabilities",
+                    "mimeType": "application/json",
+                },
+                {
+                    "uri": "metrics",
+                    "name": "System Metrics",
+                    "description": "Performance and health metrics",
+                    "mimeType": "application/json",
+                },
+            ]
+        },
+    }
+)
+_GET_MCP_TOOLS_BODY = encode_json(
+    {"tool": "getMcpTools", "success": True, "result": {"tools": TOOL_DEFINITIONS}}
+)
 
 
-@router.post("/deploy_service")
-async def deploy_service_tool(
-    request: Request,
-    user: UserPrincipal = Depends(get_current_user),
-):
-    """Deploy a service to a specific environment."""
-    try:
-        # Parse request body
-        body = await request.json()
-        logger.info(f"🔧 Deploy service tool called with body: {body}")
+# Pydantic models for requests
+class ToolCallRequest(BaseModel):
+    arguments: Dict[str, Any] = {}
 
-        # Handle both nested and direct parameter formats
-        if "arguments" in body:
-            # Nested format: {"arguments": {"service_name": "...", "version": "...", "environment": "..."}}
-            arguments = body["arguments"]
-        else:
-            # Direct format: {"service_name": "...", "version": "...", "environment": "..."}
-            arguments = body
 
-        # Extract arguments
-        service_name = arguments.get("service_name")
-        version = arguments.get("version")
-        environment = arguments.get("environment")
+# Environment-specific permission (and denial wording) for each tool
+_DEPLOY_ENV_PERMISSIONS = {
+    "production": ("deploy_production", "deploy to production"),
+    "staging": ("deploy_staging", "deploy to staging"),
+}
+_ROLLBACK_ENV_PERMISSIONS = {
+    "production": ("rollback_production", "perform production rollbacks"),
+    "staging": ("rollback_staging", "perform staging rollbacks"),
+}
 
-        logger.info(
-            f"🔧 Extracted parameters: service_name={service_name}, version={version}, environment={environment}"
-        )
 
-        # Validate required parameters
-        validate_tool_arguments(arguments, ["service_name", "version", "environment"])
-    except Exception as e:
-        logger.error(f"❌ Error parsing request body: {e}")
-        raise HTTPException(status_code=400, detail=f"Invalid request format: {str(e)}")
+def check_permission(
+    user: UserPrincipal, permission: str, resource: str = None
+) -> None:
+    """Check if user has required permission, raise HTTPException if not."""
+    if permission not in user.permission_set:
+        detail = f"Insufficient permissions to {resource or permission}"
+        raise HTTPException(status_code=403, detail=detail)
 
-    # Check environment-specific permissions
-    if environment == "production":
-        check_permission(user, "deploy_production", "deploy to production")
-    elif environment == "staging":
-        check_permission(user, "deploy_staging", "deploy to staging")
 
-    # If Cequence is enabled, route through gateway for audit and monitoring
-    if settings.CEQUENCE_ENABLED:
-        try:
-            logger.info("🌐 Routing through Cequence Gateway")
-            headers = dict(request.headers)
-
-            response = await cequence_client.deploy_service(
-                headers=headers,
-                service_name=service_name,
-                version=version,
-                environment=environment,
-            )
-            await handle_cequence_gateway_error(response, "deploy_service")
-            return await parse_mcp_response(response)
+def check_deploy_permission(user: UserPrincipal, environment: str) -> None:
+    """Check the environment-specific deploy permission, if there is one."""
+    required = _DEPLOY_ENV_PERMISSIONS.get(environment)
+    if required:
+        check_permission(user, *required)
 
-        except Exception as e:
-            logger.error(f"❌ Error routing through Cequence: {e}")
-            logger.info("🔄 Falling back to direct mode")
-            # Fall through to direct mode
 
-    # Direct mode (original implementation)
-    try:
-        # Perform deployment
-        deployment, http_status, json_response = await deploy_service.deploy(
-            service_name, version, environment
+def check_rollback_permission(user: UserPrincipal, environment: str) -> None:
+    """Check the environment-specific rollback permission; reject unknown ones."""
+    required = _ROLLBACK_ENV_PERMISSIONS.get(environment)
+    if required is None:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid environment. Must be 'staging' or 'production'",
         )
+    check_permission(user, *required)
 
-        return {"tool": "deploy_service", "success": True, "result": json_response}
 
-    except Exception as e:
-        logger.error(f"❌ Error executing deploy_service: {e}")
-        return {"tool": "deploy_service", "success": False, "error": str(e)}
+# Tools that need at least one of these permissions whatever the arguments, so
+# callers holding none are rejected before the arguments are parsed. Deploys to
+# development need no permission, so deploy_service isn't listed.
+_TOOL_ANY_PERMISSIONS: Dict[str, FrozenSet[str]] = {
+    "rollback_deployment": frozenset(
+        permission for permission, _ in _ROLLBACK_ENV_PERMISSIONS.values()
+    ),
+}
 
 
-@router.post("/rollback_deployment")
-async def rollback_deployment_tool(
-    request: Request,
-    user: UserPrincipal = Depends(get_current_user),
-):
-    """Rollback a deployment to previous version."""
-    try:
-        # Parse request body
-        body = await request.json()
-        logger.info(f"🔧 Rollback deployment tool called with body: {body}")
+def check_tool_access(user: UserPrincipal, tool_name: str) -> None:
+    """Reject callers holding none of a tool's permissions, before parsing."""
+    any_permissions = _TOOL_ANY_PERMISSIONS.get(tool_name)
+    if any_permissions is not None and any_permissions.isdisjoint(user.permission_set):
+        raise HTTPException(
+            status_code=403, detail=f"Insufficient permissions to call {tool_name}"
+        )
 
-        # Handle both nested and direct parameter formats
-        if "arguments" in body:
-            # Nested format: {"arguments": {"deployment_id": "...", "reason": "...", "environment": "..."}}
-            arguments = body["arguments"]
-        else:
-            # Direct format: {"deployment_id": "...", "reason": "...", "environment": "..."}
-            arguments = body
 
-        # Extract arguments
-        deployment_id = arguments.get("deployment_id")
-        reason = arguments.get("reason")
-        environment = arguments.get("environment")
+# Required parameters per tool, for the endpoints that take raw arguments
+_DEPLOY_SERVICE_PARAMS = ("service_name", "version", "environment")
+_ROLLBACK_DEPLOYMENT_PARAMS = ("deployment_id", "reason", "environment")
 
-        logger.info(
-            f"🔧 Extracted parameters: deployment_id={deployment_id}, reason={reason}, environment={environment}"
-        )
 
-        # Validate required parameters
-        validate_tool_arguments(arguments, ["deployment_id", "reason", "environment"])
-    except Exception as e:
-        logger.error(f"❌ Error parsing request body: {e}")
-        raise HTTPException(status_code=400, detail=f"Invalid request format: {str(e)}")
-
-    # Check environment-specific permissions
-    if environment == "production":
-        check_permission(user, "rollback_production", "perform production rollbacks")
-    elif environment == "staging":
-        check_permission(user, "rollback_staging", "perform staging rollbacks")
-    else:
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid environment. Must be 'staging' or 'production'",
-        )
+def find_missing_arguments(
+    arguments: Dict[str, Any], required_params: Sequence[str]
+) -> List[str]:
+    """Return the required parameters that are absent or empty, in order."""
+    return [param for param in required_params if not arguments.get(param)]
 
-    # If Cequence is enabled, route through gateway for audit and monitoring
-    if settings.CEQUENCE_ENABLED:
-        try:
-            logger.info("🌐 Routing through Cequence Gateway")
-            headers = dict(request.headers)
-
-            response = await cequence_client.rollback_deployment(
-                headers=headers,
-                deployment_id=deployment_id,
-                reason=reason,
-                environment=environment,
-            )
-            await handle_cequence_gateway_error(response, "rollback_deployment")
-            return await parse_mcp_response(response)
 
-        except Exception as e:
-            logger.error(f"❌ Error routing through Cequence: {e}")
-            logger.info("🔄 Falling back to direct mode")
-            # Fall through to direct mode
+def parse_tool_arguments(
+    struct_type: Type[ArgsStruct], tool_name: str, arguments: Dict[str, Any]
+) -> ArgsStruct:
+    """
+    Validate tool arguments into the tool's argument struct in a single pass.
 
-    # Direct mode (original implementation)
+    Args:
+        struct_type: msgspec argument struct for the tool
+        tool_name: Tool name used in the error message
+        arguments: Raw tool arguments
+
+    Returns:
+        The validated argument struct
+
+    Raises:
+        HTTPException: 400 if required parameters are missing or empty, 422 if
+            the arguments do not match the struct otherwise
+    """
     try:
-        # Perform rollback using unified service method
-        rollback, http_status, json_response = await rollback_service.rollback(
-            deployment_id, reason, environment=environment
+        return convert_tool_arguments(arguments, struct_type)
+    except msgspec.ValidationError as e:
+        # msgspec stops at the first error; name every missing parameter at once
+        missing = find_missing_arguments(arguments, required_fields(struct_type))
+        if missing:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Missing required parameters: {', '.join(missing)}",
+            )
+        raise HTTPException(
+            status_code=422, detail=f"Invalid arguments for {tool_name}: {e}"
         )
 
-        return {"tool": "rollback_deployment", "success": True, "result": json_response}
 
-    except Exception as e:
-        logger.error(f"❌ Error executing rollback_deployment: {e}")
-        return {"tool": "rollback_deployment", "success": False, "error": str(e)}
+# Clients may reuse a successful authentication for as long as the server-side
+# session cache would serve it
+_AUTH_CACHE_CONTROL = f"private, max-age={int(settings.SESSION_CACHE_TTL)}"
 
+# Encoded success bodies under the session cache's key (a hash of the tokens),
+# each stored with the cached UserPrincipal it was built from
+_AUTH_RESPONSE_BODIES = TTLCache(ttl=settings.SESSION_CACHE_TTL)
 
-@router.post("/authenticate_user")
-async def authenticate_user_tool(
-    request: Request,
-    user: UserPrincipal = Depends(get_current_user),
-):
-    """Authenticate user and get permissions."""
-    try:
-        # Parse request body
-        body = await request.json()
-        logger.info(f"🔧 Authenticate user tool called with body: {body}")
 
-        # Handle both nested and direct parameter formats
-        if "arguments" in body:
-            # Nested format: {"arguments": {"session_token": "...", "refresh_token": "..."}}
-            arguments = body["arguments"]
-        else:
-            # Direct format: {"session_token": "...", "refresh_token": "..."}
-            arguments = body
+def authenticate_user_result(user_principal: UserPrincipal) -> Dict[str, Any]:
+    """Build the successful authenticate_user tool result for a principal."""
+    return {
+        "tool": "authenticate_user",
+        "success": True,
+        "result": {
+            "user_id": user_principal.user_id,
+            "name": user_principal.name,
+            "email": user_principal.email,
+            "roles": user_principal.roles,
+            "permissions": user_principal.permissions,
+            "tenant": user_principal.tenant,
+        },
+    }
+
+
+def _authenticate_user_body(session_key: str, user_principal: UserPrincipal) -> bytes:
+    """Return the encoded success body, encoding once per cached session."""
+    entry = _AUTH_RESPONSE_BODIES.get(session_key)
+    # A re-validated session yields a new principal, so the body is rebuilt
+    if entry is not None and entry[0] is user_principal:
+        return entry[1]
+
+    body = encode_json(authenticate_user_result(user_principal))
+    _AUTH_RESPONSE_BODIES.set(session_key, (user_principal, body))
+    return body
+
+
+def authenticate_user_response(
+    result: Optional[Dict[str, Any]] = None,
+    user_principal: Optional[UserPrincipal] = None,
+    session_key: Optional[str] = None,
+) -> Response:
+    """
+    Render an authenticate_user result with HTTP caching headers.
+
+    Successful results are privately cacheable for a short time; failures are
+    marked no-store. When given the principal and its session cache key
+    instead of a result, the body is encoded once per cached session and the
+    bytes reused on later hits.
+
+    Args:
+        result: Tool result to render
+        user_principal: Authenticated principal to render a success for
+        session_key: Session cache key the principal is cached under
+
+    Returns:
+        JSON response with a Cache-Control header
+    """
+    if user_principal is not None:
+        body = _authenticate_user_body(session_key, user_principal)
+    elif not result.get("success"):
+        return FastJSONResponse(result, headers={"Cache-Control": "no-store"})
+    else:
+        body = encode_json(result)
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"Cache-Control": _AUTH_CACHE_CONTROL},
+    )
 
-        # Extract arguments
-        session_token = arguments.get("session_token")
-        refresh_token = arguments.get("refresh_token")
 
-        logger.info(
-            f"🔧 Extracted parameters: session_token={session_token[:20] if session_token else None}..., refresh_token={'present' if refresh_token else 'not present'}"
+async def handle_cequence_gateway_error(response, operation: str) -> None:
+    """Handle Cequence Gateway errors with fallback logging."""
+    if response.status_code >= 400:
+        logger.warning(
+            "⚠️ Cequence Gateway returned %s for %s, falling back to direct mode",
+            response.status_code,
+            operation,
         )
+        raise Exception(f"Gateway error: {response.status_code}")
 
-        # Validate required parameters
-        validate_tool_arguments(arguments, ["session_token"])
-    except Exception as e:
-        logger.error(f"❌ Error parsing request body: {e}")
-        raise HTTPException(status_code=400, detail=f"Invalid request format: {str(e)}")
 
-    # This tool is handled directly by the MCP server without Cequence Gateway routing
+@router.get("")
+async def list_tools(user: UserPrincipal = Depends(get_current_user)):
+    """List all available MCP tools."""
+    return Response(content=_TOOL_LIST_BODY, media_type="application/json")
+
+
+async def _route_deploy_service(
+    user: UserPrincipal, args: DeployServiceArgsS, headers: Dict[str, str]
+) -> Dict[str, Any]:
+    """Route a deploy_service tool call through the Cequence Gateway."""
+    response = await cequence_client.deploy_service(
+        headers=headers,
+        service_name=args.service_name,
+        version=args.version,
+        environment=args.environment,
+    )
+    await handle_cequence_gateway_error(response, "deploy_service")
+    return parse_mcp_gateway_response(response)
+
+
+async def _route_rollback_deployment(
+    user: UserPrincipal, args: RollbackDeploymentArgsS, headers: Dict[str, str]
+) -> Dict[str, Any]:
+    """Route a rollback_deployment tool call through the Cequence Gateway."""
+    # Use unified rollback function with environment parameter
+    response = await cequence_client.rollback_deployment(
+        headers=headers,
+        deployment_id=args.deployment_id,
+        reason=args.reason,
+        environment=args.environment,
+    )
+    await handle_cequence_gateway_error(response, "rollback_deployment")
+    return parse_mcp_gateway_response(response)
+
+
+async def _call_deploy_service(
+    user: UserPrincipal, args: DeployServiceArgsS
+) -> Dict[str, Any]:
+    """Run a deploy_service tool call directly."""
+    # Perform deployment
+    deployment, http_status, json_response = await deploy_service.deploy(
+        args.service_name, args.version, args.environment
+    )
+
+    return {"tool": "deploy_service", "success": True, "result": json_response}
+
+
+async def _call_rollback_deployment(
+    user: UserPrincipal, args: RollbackDeploymentArgsS
+) -> Dict[str, Any]:
+    """Run a rollback_deployment tool call directly."""
+    # Perform rollback using unified service method
+    rollback, http_status, json_response = await rollback_service.rollback(
+        args.deployment_id, args.reason, environment=args.environment
+    )
+
+    return {"tool": "rollback_deployment", "success": True, "result": json_response}
+
+
+async def _call_authenticate_user(
+    user: UserPrincipal, args: AuthenticateUserArgsS
+) -> Response:
+    """Run an authenticate_user tool call directly."""
+    session_token = args.session_token
+    refresh_token = args.refresh_token
+
+    # Validate session with Descope
     try:
-        # Validate session with Descope
-        jwt_response = descope_client.validate_session(
+        user_principal = await descope_client.aget_user_principal(
             session_token=session_token, refresh_token=refresh_token
         )
-
-        # Extract user principal
-        user_principal = descope_client.extract_user_principal(
-            jwt_response, session_token
+    except DescopeAuthError as e:
+        return authenticate_user_response(
+            {
+                "tool": "authenticate_user",
+                "success": False,
+                "error": f"Authentication failed: {e.detail}",
+            }
         )
 
-        return {
-            "tool": "authenticate_user",
-            "success": True,
-            "result": {
-                "user_id": user_principal.user_id,
-                "name": user_principal.name,
-                "email": user_principal.email,
-                "roles": user_principal.roles,
-                "permissions": user_principal.permissions,
-                "tenant": user_principal.tenant,
-            },
-        }
-
-    except Exception as e:
-        return {
-            "tool": "authenticate_user",
-            "success": False,
-            "error": f"Authentication failed: {str(e)}",
-        }
+    return authenticate_user_response(
+        user_principal=user_principal,
+        session_key=session_cache_key(session_token, refresh_token),
+    )
+
+
+# Skips the gateway for a while once it keeps failing
+cequence_breaker = CircuitBreaker("Cequence Gateway")
+
+# Expected tool failures, reported in the tool result rather than as HTTP errors
+_TOOL_ERRORS = (ValueError, httpx.HTTPError, asyncio.TimeoutError)
+
+
+# Tool dispatch tables for run_tool. Arguments are parsed and the
+# environment permission checked once, before routing, so a gateway fallback
+# doesn't repeat either. Tools without a gateway handler are always run directly.
+_TOOL_ARGUMENTS: Dict[
+    str, Tuple[Type[msgspec.Struct], Optional[Callable[[UserPrincipal, str], None]]]
+] = {
+    "deploy_service": (DeployServiceArgsS, check_deploy_permission),
+    "rollback_deployment": (RollbackDeploymentArgsS, check_rollback_permission),
+    "authenticate_user": (AuthenticateUserArgsS, None),
+}
+_GATEWAY_TOOL_HANDLERS: Dict[
+    str,
+    Callable[[UserPrincipal, Any, Dict[str, str]], Awaitable[Dict[str, Any]]],
+] = {
+    "deploy_service": _route_deploy_service,
+    "rollback_deployment": _route_rollback_deployment,
+}
+_TOOL_HANDLERS: Dict[
+    str, Callable[[UserPrincipal, Any], Awaitable[Union[Dict[str, Any], Response]]]
+] = {
+    "deploy_service": _call_deploy_service,
+    "rollback_deployment": _call_rollback_deployment,
+    "authenticate_user": _call_authenticate_user,
+}
+
+
+async def run_tool(tool_name: str, request: Request, user: UserPrincipal) -> Response:
+    """
+    Parse, authorize and run a tool call.
+
+    Shared by the dedicated tool endpoints and call_tool, so every tool call is
+    validated the same way.
+
+    Args:
+        tool_name: Name of the tool to run
+        request: Incoming request holding the tool arguments
+        user: Authenticated caller
+
+    Returns:
+        JSON response with the tool result
+
+    Raises:
+        HTTPException: If the tool is unknown, the caller lacks permission or
+            the arguments are invalid
+    """
+    spec = _TOOL_ARGUMENTS.get(tool_name)
+    if spec is None:
+        raise HTTPException(status_code=404, detail=f"Tool not found: {tool_name}")
+    struct_type, check_environment_permission = spec
+    check_tool_access(user, tool_name)
+
+    # Decode the body with msgspec instead of FastAPI's generic body parsing
+    try:
+        arguments = decode_tool_arguments(await request.body())
+    except msgspec.DecodeError as e:
+        logger.error("❌ Error parsing request body: %s", e)
+        raise HTTPException(status_code=400, detail=f"Invalid request format: {e}")
 
+    # Log argument names only; values may hold session tokens
+    logger.info("🔧 Tool called: %s with arguments: %s", tool_name, list(arguments))
 
-@router.post("/{tool_name}")
-async def call_tool(
-    tool_name: str,
-    tool_request: ToolCallRequest,
-    request: Request,
-    user: UserPrincipal = Depends(get_current_user),
-):
-    """Call a specific MCP tool."""
-    logger.info(f"🔧 Tool called: {tool_name} with arguments: {tool_request.arguments}")
+    args = parse_tool_arguments(struct_type, tool_name, arguments)
+    if check_environment_permission is not None:
+        check_environment_permission(user, args.environment)
 
     # If Cequence is enabled, route through gateway for audit and monitoring
-    if settings.CEQUENCE_ENABLED:
+    gateway_handler = (
+        _GATEWAY_TOOL_HANDLERS.get(tool_name)
+        if settings.CEQUENCE_ENABLED and cequence_breaker.allow()
+        else None
+    )
+    if gateway_handler is not None:
         try:
             logger.info("🌐 Routing tool call through Cequence Gateway")
-            headers = dict(request.headers)
-
-            if tool_name == "deploy_service":
-                validate_tool_arguments(
-                    tool_request.arguments, ["service_name", "version", "environment"]
-                )
-
-                service_name = tool_request.arguments.get("service_name")
-                version = tool_request.arguments.get("version")
-                environment = tool_request.arguments.get("environment")
-
-                # Check environment-specific permissions
-                if environment == "production":
-                    check_permission(user, "deploy_production", "deploy to production")
-                elif environment == "staging":
-                    check_permission(user, "deploy_staging", "deploy to staging")
-
-                response = await cequence_client.deploy_service(
-                    headers=headers,
-                    service_name=service_name,
-                    version=version,
-                    environment=environment,
-                )
-                await handle_cequence_gateway_error(response, "deploy_service")
-                return await parse_mcp_response(response)
-
-            elif tool_name == "rollback_deployment":
-                validate_tool_arguments(
-                    tool_request.arguments, ["deployment_id", "reason", "environment"]
-                )
-
-                deployment_id = tool_request.arguments.get("deployment_id")
-                reason = tool_request.arguments.get("reason")
-                environment = tool_request.arguments.get("environment")
-
-                # Check environment-specific permissions
-                if environment == "production":
-                    check_permission(
-                        user, "rollback_production", "perform production rollbacks"
-                    )
-                elif environment == "staging":
-                    check_permission(
-                        user, "rollback_staging", "perform staging rollbacks"
-                    )
-                else:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="Invalid environment. Must be 'staging' or 'production'",
-                    )
-
-                # Use unified rollback function with environment parameter
-                response = await cequence_client.rollback_deployment(
-                    headers=headers,
-                    deployment_id=deployment_id,
-                    reason=reason,
-                    environment=environment,
-                )
-
-                await handle_cequence_gateway_error(response, "rollback_deployment")
-                return await parse_mcp_response(response)
-
+            result = await gateway_handler(
+                user, args, forwarded_headers(request.headers)
+            )
+            cequence_breaker.record_success()
+            return FastJSONResponse(result)
         except Exception as e:
-            logger.error(f"❌ Error routing tool call through Cequence: {e}")
+            cequence_breaker.record_failure()
+            logger.error("❌ Error routing tool call through Cequence: %s", e)
             logger.info("🔄 Falling back to direct mode")
             # Fall through to direct mode
 
     # Direct mode (original implementation)
-    try:
-        if tool_name == "deploy_service":
-            validate_tool_arguments(
-                tool_request.arguments, ["service_name", "version", "environment"]
-            )
+    handler = _TOOL_HANDLERS[tool_name]
 
-            service_name = tool_request.arguments.get("service_name")
-            version = tool_request.arguments.get("version")
-            environment = tool_request.arguments.get("environment")
+    # HTTPExceptions (403, 422, ...) propagate to FastAPI; anything not listed in
+    # _TOOL_ERRORS is left to the error handling middleware
+    try:
+        result = await handler(user, args)
+    except _TOOL_ERRORS as e:
+        logger.error("❌ Error executing tool %s: %s", tool_name, e)
+        result = {"tool": tool_name, "success": False, "error": str(e)}
 
-            # Check environment-specific permissions
-            if environment == "production":
-                check_permission(user, "deploy_production", "deploy to production")
-            elif environment == "staging":
-                check_permission(user, "deploy_staging", "deploy to staging")
+    if isinstance(result, Response):
+        return result
+    # Results are plain JSON types, so skip jsonable_encoder and render directly
+    return FastJSONResponse(result)
 
-            # Perform deployment
-            deployment, http_status, json_response = await deploy_service.deploy(
-                service_name, version, environment
-            )
 
-            return {"tool": tool_name, "success": True, "result": json_response}
+# The dedicated endpoints serve these tools ahead of call_tool; both go through
+# run_tool.
+@router.post("/deploy_service")
+async def deploy_service_tool(
+    request: Request,
+    user: UserPrincipal = Depends(get_current_user),
+):
+    """Deploy a service to a specific environment."""
+    return await run_tool("deploy_service", request, user)
 
-        elif tool_name == "rollback_deployment":
-            validate_tool_arguments(
-                tool_request.arguments, ["deployment_id", "reason", "environment"]
-            )
 
-            deployment_id = tool_request.arguments.get("deployment_id")
-            reason = tool_request.arguments.get("reason")
-            environment = tool_request.arguments.get("environment")
-
-            # Check environment-specific permissions
-            if environment == "production":
-                check_permission(
-                    user, "rollback_production", "perform production rollbacks"
-                )
-            elif environment == "staging":
-                check_permission(user, "rollback_staging", "perform staging rollbacks")
-            else:
-                raise HTTPException(
-                    status_code=400,
-                    detail="Invalid environment. Must be 'staging' or 'production'",
-                )
-
-            # Perform rollback using unified service method
-            rollback, http_status, json_response = await rollback_service.rollback(
-                deployment_id, reason, environment=environment
-            )
+@router.post("/rollback_deployment")
+async def rollback_deployment_tool(
+    request: Request,
+    user: UserPrincipal = Depends(get_current_user),
+):
+    """Rollback a deployment to previous version."""
+    return await run_tool("rollback_deployment", request, user)
 
-            return {"tool": tool_name, "success": True, "result": json_response}
-
-        elif tool_name == "authenticate_user":
-            validate_tool_arguments(tool_request.arguments, ["session_token"])
-
-            session_token = tool_request.arguments.get("session_token")
-            refresh_token = tool_request.arguments.get("refresh_token")
-
-            # Validate session with Descope
-            try:
-                jwt_response = descope_client.validate_session(
-                    session_token=session_token, refresh_token=refresh_token
-                )
-
-                # Extract user principal
-                user_principal = descope_client.extract_user_principal(
-                    jwt_response, session_token
-                )
-
-                return {
-                    "tool": tool_name,
-                    "success": True,
-                    "result": {
-                        "user_id": user_principal.user_id,
-                        "name": user_principal.name,
-                        "email": user_principal.email,
-                        "roles": user_principal.roles,
-                        "permissions": user_principal.permissions,
-                        "tenant": user_principal.tenant,
-                    },
-                }
-
-            except Exception as e:
-                return {
-                    "tool": tool_name,
-                    "success": False,
-                    "error": f"Authentication failed: {str(e)}",
-                }
-
-        else:
-            raise HTTPException(status_code=404, detail=f"Tool not found: {tool_name}")
 
-    except Exception as e:
-        logger.error(f"❌ Error executing tool {tool_name}: {e}")
-        return {"tool": tool_name, "success": False, "error": str(e)}
+@router.post("/authenticate_user")
+async def authenticate_user_tool(
+    request: Request,
+    user: UserPrincipal = Depends(get_current_user),
+):
+    """Authenticate user and get permissions."""
+    return await run_tool("authenticate_user", request, user)
 
 
 # MCP Tool endpoints for Cequence Gateway compatibility
@@ -637,7 +624,7 @@ async def get_mcp_resources_logs_tool(
     try:
         # Parse request body directly since MCP protocol sends parameters in body
         body = await request.json()
-        logger.info(f"🔧 MCP Tool: getMcpResourcesLogs received body: {body}")
+        logger.info("🔧 MCP Tool: getMcpResourcesLogs received body: %s", body)
 
         # Extract arguments from MCP request body
         arguments = (
@@ -648,7 +635,10 @@ async def get_mcp_resources_logs_tool(
         since = arguments.get("since")
 
         logger.info(
-            f"🔧 MCP Tool: getMcpResourcesLogs called with level={level}, limit={limit}, since={since}"
+            "🔧 MCP Tool: getMcpResourcesLogs called with level=%s, limit=%s, since=%s",
+            level,
+            limit,
+            since,
         )
 
         # Check permissions
@@ -659,9 +649,6 @@ async def get_mcp_resources_logs_tool(
             user_permissions=user.permissions, level=level, limit=limit
         )
 
-        # Apply limit
-        logs = logs[:limit]
-
         return {
             "tool": "getMcpResourcesLogs",
             "success": True,
@@ -669,12 +656,12 @@ async def get_mcp_resources_logs_tool(
                 "uri": "logs",
                 "type": "logs",
                 "count": len(logs),
-                "data": [log.dict() for log in logs],
+                "data": LOG_LIST_ADAPTER.dump_python(logs),
             },
         }
 
     except Exception as e:
-        logger.error(f"❌ Error in getMcpResourcesLogs: {e}")
+        logger.error("❌ Error in getMcpResourcesLogs: %s", e)
         return {"tool": "getMcpResourcesLogs", "success": False, "error": str(e)}
 
 
@@ -686,7 +673,7 @@ async def get_mcp_resources_metrics_tool(
     try:
         # Parse request body directly since MCP protocol sends parameters in body
         body = await request.json()
-        logger.info(f"🔧 MCP Tool: getMcpResourcesMetrics received body: {body}")
+        logger.info("🔧 MCP Tool: getMcpResourcesMetrics received body: %s", body)
 
         # Extract arguments from MCP request body
         arguments = (
@@ -697,7 +684,10 @@ async def get_mcp_resources_metrics_tool(
         metric_type = arguments.get("metric_type")
 
         logger.info(
-            f"🔧 MCP Tool: getMcpResourcesMetrics called with limit={limit}, service={service}, metric_type={metric_type}"
+            "🔧 MCP Tool: getMcpResourcesMetrics called with limit=%s, service=%s, metric_type=%s",
+            limit,
+            service,
+            metric_type,
         )
 
         # Check permissions
@@ -716,12 +706,12 @@ async def get_mcp_resources_metrics_tool(
                 "uri": "metrics",
                 "type": "metrics",
                 "count": len(metrics),
-                "data": [metric.dict() for metric in metrics],
+                "data": METRIC_LIST_ADAPTER.dump_python(metrics),
             },
         }
 
     except Exception as e:
-        logger.error(f"❌ Error in getMcpResourcesMetrics: {e}")
+        logger.error("❌ Error in getMcpResourcesMetrics: %s", e)
         return {"tool": "getMcpResourcesMetrics", "success": False, "error": str(e)}
 
 
@@ -733,7 +723,7 @@ async def post_mcp_tools_deploy_service_tool(
     try:
         # Parse request body directly since MCP protocol sends parameters in body
         body = await request.json()
-        logger.info(f"🔧 MCP Tool: postMcpToolsDeployService received body: {body}")
+        logger.info("🔧 MCP Tool: postMcpToolsDeployService received body: %s", body)
 
         # Extract arguments from MCP request body
         arguments = (
@@ -744,20 +734,19 @@ async def post_mcp_tools_deploy_service_tool(
         environment = arguments.get("environment")
 
         logger.info(
-            f"🔧 MCP Tool: postMcpToolsDeployService called with service_name={service_name}, version={version}, environment={environment}"
+            "🔧 MCP Tool: postMcpToolsDeployService called with service_name=%s, version=%s, environment=%s",
+            service_name,
+            version,
+            environment,
         )
 
         # Validate required parameters
-        if not service_name or not version or not environment:
-            raise ValueError(
-                "Missing required parameters: service_name, version, environment"
-            )
+        missing = find_missing_arguments(arguments, _DEPLOY_SERVICE_PARAMS)
+        if missing:
+            raise ValueError(f"Missing required parameters: {', '.join(missing)}")
 
         # Check environment-specific permissions
-        if environment == "production":
-            check_permission(user, "deploy_production", "deploy to production")
-        elif environment == "staging":
-            check_permission(user, "deploy_staging", "deploy to staging")
+        check_deploy_permission(user, environment)
 
         # Perform deployment
         deployment, http_status, json_response = await deploy_service.deploy(
@@ -780,7 +769,7 @@ async def post_mcp_tools_deploy_service_tool(
         }
 
     except Exception as e:
-        logger.error(f"❌ Error in postMcpToolsDeployService: {e}")
+        logger.error("❌ Error in postMcpToolsDeployService: %s", e)
         return {"tool": "postMcpToolsDeployService", "success": False, "error": str(e)}
 
 
@@ -793,7 +782,7 @@ async def post_mcp_tools_rollback_deployment_tool(
         # Parse request body directly since MCP protocol sends parameters in body
         body = await request.json()
         logger.info(
-            f"🔧 MCP Tool: postMcpToolsRollbackDeployment received body: {body}"
+            "🔧 MCP Tool: postMcpToolsRollbackDeployment received body: %s", body
         )
 
         # Extract arguments from MCP request body
@@ -805,14 +794,16 @@ async def post_mcp_tools_rollback_deployment_tool(
         environment = arguments.get("environment")
 
         logger.info(
-            f"🔧 MCP Tool: postMcpToolsRollbackDeployment called with deployment_id={deployment_id}, reason={reason}, environment={environment}"
+            "🔧 MCP Tool: postMcpToolsRollbackDeployment called with deployment_id=%s, reason=%s, environment=%s",
+            deployment_id,
+            reason,
+            environment,
         )
 
         # Validate required parameters
-        if not deployment_id or not reason or not environment:
-            raise ValueError(
-                "Missing required parameters: deployment_id, reason, environment"
-            )
+        missing = find_missing_arguments(arguments, _ROLLBACK_DEPLOYMENT_PARAMS)
+        if missing:
+            raise ValueError(f"Missing required parameters: {', '.join(missing)}")
 
         # Check environment-specific permissions
         if environment == "production":
@@ -841,7 +832,7 @@ async def post_mcp_tools_rollback_deployment_tool(
         }
 
     except Exception as e:
-        logger.error(f"❌ Error in postMcpToolsRollbackDeployment: {e}")
+        logger.error("❌ Error in postMcpToolsRollbackDeployment: %s", e)
         return {
             "tool": "postMcpToolsRollbackDeployment",
             "success": False,
@@ -881,7 +872,7 @@ async def get_tool(request: Request, user: UserPrincipal = Depends(get_current_u
         }
 
     except Exception as e:
-        logger.error(f"❌ Error in get: {e}")
+        logger.error("❌ Error in get: %s", e)
         return {"tool": "get", "success": False, "error": str(e)}
 
 
@@ -890,33 +881,8 @@ async def get_mcp_resources_tool(
     request: Request, user: UserPrincipal = Depends(get_current_user)
 ):
     """MCP tool endpoint for listing MCP resources - called by Cequence Gateway."""
-    try:
-        logger.info("🔧 MCP Tool: getMcpResources called")
-
-        MCP_RESOURCES = [
-            {
-                "uri": "logs",
-                "name": "System Logs",
-                "description": "Application and system logs with filtering capabilities",
-                "mimeType": "application/json",
-            },
-            {
-                "uri": "metrics",
-                "name": "System Metrics",
-                "description": "Performance and health metrics",
-                "mimeType": "application/json",
-            },
-        ]
-
-        return {
-            "tool": "getMcpResources",
-            "success": True,
-            "result": {"resources": MCP_RESOURCES},
-        }
-
-    except Exception as e:
-        logger.error(f"❌ Error in getMcpResources: {e}")
-        return {"tool": "getMcpResources", "success": False, "error": str(e)}
+    logger.info("🔧 MCP Tool: getMcpResources called")
+    return Response(content=_GET_MCP_RESOURCES_BODY, media_type="application/json")
 
 
 @router.post("/getMcpTools")
@@ -924,130 +890,8 @@ async def get_mcp_tools_tool(
     request: Request, user: UserPrincipal = Depends(get_current_user)
 ):
     """MCP tool endpoint for listing MCP tools - called by Cequence Gateway."""
-    try:
-        logger.info("🔧 MCP Tool: getMcpTools called")
-
-        MCP_TOOLS = [
-            {
-                "name": "deploy_service",
-                "description": "Deploy a service to a specific environment",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "service_name": {
-                            "type": "string",
-                            "description": "Name of the service to deploy",
-                        },
-                        "version": {
-                            "type": "string",
-                            "description": "Version to deploy",
-                        },
-                        "environment": {
-                            "type": "string",
-                            "enum": ["development", "staging", "production"],
-                            "description": "Target environment",
-                        },
-                    },
-                    "required": ["service_name", "version", "environment"],
-                },
-            },
-            {
-                "name": "rollback_deployment",
-                "description": "Rollback a deployment to previous version",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "deployment_id": {
-                            "type": "string",
-                            "description": "ID of the deployment to rollback",
-                        },
-                        "reason": {
-                            "type": "string",
-                            "description": "Reason for the rollback",
-                        },
-                        "environment": {
-                            "type": "string",
-                            "enum": ["staging", "production"],
-                            "description": "Environment to rollback",
-                        },
-                    },
-                    "required": ["deployment_id", "reason", "environment"],
-                },
-            },
-            {
-                "name": "authenticate_user",
-                "description": "Authenticate user and get permissions",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "session_token": {
-                            "type": "string",
-                            "description": "Descope session token",
-                        },
-                        "refresh_token": {
-                            "type": "string",
-                            "description": "Descope refresh token (optional)",
-                        },
-                    },
-                    "required": ["session_token"],
-                },
-            },
-            {
-                "name": "getMcpResourcesLogs",
-                "description": "Get system logs with optional filtering",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "level": {
-                            "type": "string",
-                            "enum": ["DEBUG", "INFO", "WARN", "ERROR"],
-                            "description": "Log level filter",
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Limit number of results",
-                        },
-                        "since": {
-                            "type": "string",
-                            "description": "Filter logs since timestamp (ISO format)",
-                        },
-                    },
-                    "required": [],
-                },
-            },
-            {
-                "name": "getMcpResourcesMetrics",
-                "description": "Get performance metrics with optional filtering",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "limit": {
-                            "type": "integer",
-                            "description": "Limit number of results",
-                        },
-                        "service": {
-                            "type": "string",
-                            "description": "Filter by service name",
-                        },
-                        "metric_type": {
-                            "type": "string",
-                            "description": "Type of metric to retrieve",
-                        },
-                    },
-                    "required": [],
-                },
-            },
-        ]
-
-        return {
-            "tool": "getMcpTools",
-            "success": True,
-            "result": {"tools": MCP_TOOLS},
-        }
-
-    except Exception as e:
-        logger.error(f"❌ Error in getMcpTools: {e}")
-        return {"tool": "getMcpTools", "success": False, "error": str(e)}
+    logger.info("🔧 MCP Tool: getMcpTools called")
+    return Response(content=_GET_MCP_TOOLS_BODY, media_type="application/json")
 
 
 @router.post("/postMcpToolsAuthenticateUser")
@@ -1058,7 +902,7 @@ async def post_mcp_tools_authenticate_user_tool(
     try:
         # Parse request body directly since MCP protocol sends parameters in body
         body = await request.json()
-        logger.info(f"🔧 MCP Tool: postMcpToolsAuthenticateUser received body: {body}")
+        logger.info("🔧 MCP Tool: postMcpToolsAuthenticateUser received body: %s", body)
 
         # Extract arguments from MCP request body
         arguments = (
@@ -1068,7 +912,8 @@ async def post_mcp_tools_authenticate_user_tool(
         refresh_token = arguments.get("refresh_token")
 
         logger.info(
-            f"🔧 MCP Tool: postMcpToolsAuthenticateUser called with session_token={'***' if session_token else 'None'}"
+            "🔧 MCP Tool: postMcpToolsAuthenticateUser called with session_token=%s",
+            "***" if session_token else "None",
         )
 
         # Validate required parameters
@@ -1077,13 +922,10 @@ async def post_mcp_tools_authenticate_user_tool(
 
         # Authenticate user using Descope
         try:
-            jwt_response = descope_client.validate_session(
+            user_principal = await descope_client.aget_user_principal(
                 session_token=session_token, refresh_token=refresh_token
             )
 
-            # Extract user information from JWT response
-            user_principal = descope_client.extract_user_principal(jwt_response)
-
             return {
                 "tool": "postMcpToolsAuthenticateUser",
                 "success": True,
@@ -1100,18 +942,40 @@ async def post_mcp_tools_authenticate_user_tool(
                 },
             }
 
-        except Exception as auth_error:
-            logger.error(f"❌ Authentication failed: {auth_error}")
+        except DescopeAuthError as auth_error:
+            logger.error("❌ Authentication failed: %s", auth_error.detail)
             return {
                 "tool": "postMcpToolsAuthenticateUser",
                 "success": False,
-                "error": f"Authentication failed: {str(auth_error)}",
+                "error": f"Authentication failed: {auth_error.detail}",
             }
 
     except Exception as e:
-        logger.error(f"❌ Error in postMcpToolsAuthenticateUser: {e}")
+        logger.error("❌ Error in postMcpToolsAuthenticateUser: %s", e)
         return {
             "tool": "postMcpToolsAuthenticateUser",
             "success": False,
             "error": str(e),
         }
+
+
+# Registered last: routes match in registration order, so the catch-all would
+# otherwise shadow the fixed tool endpoints above.
+@router.post(
+    "/{tool_name}",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": ToolCallRequest.model_json_schema()}
+            },
+        }
+    },
+)
+async def call_tool(
+    tool_name: str,
+    request: Request,
+    user: UserPrincipal = Depends(get_current_user),
+):
+    """Call a specific MCP tool."""
+    return await run_tool(tool_name, request, user)
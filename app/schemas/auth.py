@@ -1,4 +1,5 @@
-from typing import Any, Dict, Optional
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, Optional
 
 from pydantic import BaseModel, Field
 
@@ -18,3 +19,8 @@ class UserPrincipal(BaseModel):
     jwt_response: Optional[Dict[str, Any]] = Field(
         default=None
     )  # Store full JWT response for RBAC
+
+    @cached_property
+    def permission_set(self) -> FrozenSet[str]:
+        """Permissions as a frozenset for O(1) membership checks."""
+        return frozenset(self.permissions)
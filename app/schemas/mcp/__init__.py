@@ -19,22 +19,20 @@ from .requests import (
 )
 from .resources import MCPResource, MCPResourceList, MCPTool, MCPToolList
 from .responses import (
-    AuthenticateUserResponse,
     DeploymentData,
     DeployServiceResponse,
     ErrorResponse,
-    HealthResponse,
     LogEntry,
+    LogsFilter,
     LogsResponse,
     MCPResponse,
     MetricEntry,
+    MetricsFilter,
     MetricsResponse,
     ResourceResponse,
     RollbackData,
     RollbackDeploymentResponse,
-    ServerInfoResponse,
     ToolResponse,
-    UserData,
 )
 
 __all__ = [
@@ -59,7 +57,9 @@ __all__ = [
     "RollbackData",
     "UserData",
     "ErrorResponse",
+    "LogsFilter",
     "LogsResponse",
+    "MetricsFilter",
     "MetricsResponse",
     "DeployServiceResponse",
     "RollbackDeploymentResponse",
@@ -72,3 +72,12 @@ __all__ = [
     "MCPResourceList",
     "MCPToolList",
 ]
+
+
+def __getattr__(name):
+    # Cold-path response models are resolved lazily by the responses module
+    if name in __all__:
+        from . import responses
+
+        return getattr(responses, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
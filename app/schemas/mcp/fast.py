@@ -0,0 +1,207 @@
+"""
+Fast request and response structs for MCP HTTP Server.
+
+This module mirrors the hot-path models from ``requests.py`` and
+``responses.py`` as ``msgspec.Struct`` types. Tool arguments are validated
+into structs in one C-level pass. Logs and metrics responses can carry up to 1000
+entries per request, so they are built and encoded with msgspec while the
+Pydantic models remain the source of the OpenAPI schema. Entry structs omit
+optional fields that still hold their default, which keeps unset ``service``,
+``user_id``, ``request_id`` etc. off the wire.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import (
+    Annotated,
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import msgspec
+
+NonEmptyStr = Annotated[str, msgspec.Meta(min_length=1)]
+
+
+class LogEntryS(msgspec.Struct, gc=False, frozen=True, omit_defaults=True):
+    """Struct for individual log entries (see ``LogEntry``)."""
+
+    level: str
+    message: str
+    timestamp: datetime
+    source: str
+    service: Optional[str] = None
+    user_id: Optional[str] = None
+    request_id: Optional[str] = None
+    is_loading: Optional[bool] = False
+
+
+class MetricEntryS(msgspec.Struct, gc=False, frozen=True, omit_defaults=True):
+    """Struct for individual metric entries (see ``MetricEntry``)."""
+
+    name: str
+    value: float
+    unit: str
+    timestamp: datetime
+    service: Optional[str] = None
+    tags: Optional[Dict[str, str]] = None
+    is_loading: Optional[bool] = False
+
+
+class LogsFilterS(msgspec.Struct, gc=False, frozen=True, kw_only=True):
+    """Struct for filters applied to the logs resource (see ``LogsFilter``)."""
+
+    level: Optional[str] = None
+    limit: int
+    since: Optional[str] = None
+    service: Optional[str] = None
+
+
+class MetricsFilterS(msgspec.Struct, gc=False, frozen=True):
+    """Struct for filters applied to the metrics resource (see ``MetricsFilter``)."""
+
+    limit: int
+    service: Optional[str] = None
+    metric_type: Optional[str] = None
+    time_range: Optional[str] = None
+
+
+class DeployServiceArgsS(msgspec.Struct, frozen=True):
+    """Struct for deploy_service tool arguments (see ``DeployServiceRequest``)."""
+
+    service_name: NonEmptyStr
+    version: NonEmptyStr
+    environment: Literal["development", "staging", "production"]
+
+
+class RollbackDeploymentArgsS(msgspec.Struct, frozen=True):
+    """Struct for rollback_deployment tool arguments (see ``RollbackDeploymentRequest``)."""
+
+    deployment_id: NonEmptyStr
+    reason: NonEmptyStr
+    environment: Literal["staging", "production"]
+
+
+class AuthenticateUserArgsS(msgspec.Struct, frozen=True):
+    """Struct for authenticate_user tool arguments (see ``AuthenticateUserRequest``)."""
+
+    session_token: NonEmptyStr
+    refresh_token: Optional[str] = None
+
+
+class LogsResponseS(msgspec.Struct, kw_only=True):
+    """Struct for the logs resource response (see ``LogsResponse``)."""
+
+    success: bool
+    message: Optional[str] = None
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
+    uri: str
+    type: str = "logs"
+    count: int
+    filters: Optional[LogsFilterS] = None
+    loading: Optional[bool] = False
+    pagination: Optional[Dict[str, Any]] = None
+    # Kept last so the entries can be streamed after the envelope
+    data: List[LogEntryS]
+
+
+class MetricsResponseS(msgspec.Struct, kw_only=True):
+    """Struct for the metrics resource response (see ``MetricsResponse``)."""
+
+    success: bool
+    message: Optional[str] = None
+    timestamp: datetime = msgspec.field(default_factory=datetime.now)
+    uri: str
+    type: str = "metrics"
+    count: int
+    filters: Optional[MetricsFilterS] = None
+    loading: Optional[bool] = False
+    pagination: Optional[Dict[str, Any]] = None
+    # Kept last so the entries can be streamed after the envelope
+    data: List[MetricEntryS]
+
+
+_encoder = msgspec.json.Encoder()
+_tool_body_decoder = msgspec.json.Decoder(Dict[str, Any])
+
+ArgsStruct = TypeVar("ArgsStruct", bound=msgspec.Struct)
+
+# Number of entries encoded per chunk when streaming a response body
+STREAM_CHUNK_SIZE = 200
+
+
+def to_log_entries(rows: List[Any]) -> List[LogEntryS]:
+    """Convert raw log rows (dicts or records) into log entry structs."""
+    return msgspec.convert(rows, List[LogEntryS], from_attributes=True)
+
+
+def to_metric_entries(rows: List[Any]) -> List[MetricEntryS]:
+    """Convert raw metric rows (dicts or records) into metric entry structs."""
+    return msgspec.convert(rows, List[MetricEntryS], from_attributes=True)
+
+
+def decode_tool_arguments(body: bytes) -> Dict[str, Any]:
+    """
+    Decode a raw tool call body into the tool arguments.
+
+    Accepts the nested ``{"arguments": {...}}`` format as well as the direct
+    format, where the body itself holds the arguments.
+
+    Raises:
+        msgspec.DecodeError: If the body is not a JSON object of arguments
+    """
+    payload = _tool_body_decoder.decode(body)
+    arguments = payload.get("arguments", payload)
+    if not isinstance(arguments, dict):
+        raise msgspec.ValidationError("Expected `object` - at `$.arguments`")
+    return arguments
+
+
+def convert_tool_arguments(
+    arguments: Dict[str, Any], struct_type: Type[ArgsStruct]
+) -> ArgsStruct:
+    """Validate raw tool arguments into an argument struct."""
+    return msgspec.convert(arguments, struct_type)
+
+
+@lru_cache(maxsize=None)
+def required_fields(struct_type: Type[msgspec.Struct]) -> Tuple[str, ...]:
+    """Return the names of a struct's required fields, in declaration order."""
+    return tuple(
+        field.name for field in msgspec.structs.fields(struct_type) if field.required
+    )
+
+
+def encode_json(obj: Any) -> bytes:
+    """Encode a struct (or list of structs) to JSON bytes."""
+    return _encoder.encode(obj)
+
+
+async def iter_json_chunks(
+    response: Any, entries: Sequence[Any], chunk_size: int = STREAM_CHUNK_SIZE
+) -> AsyncIterator[bytes]:
+    """
+    Encode a resource response incrementally, ``chunk_size`` entries at a time.
+
+    Args:
+        response: Response struct whose last field is an empty ``data`` list
+        entries: Entry structs to emit as the ``data`` list
+        chunk_size: Number of entries encoded per chunk
+
+    Returns:
+        Async iterator of JSON byte chunks forming a single document
+    """
+    # The envelope ends with b'"data":[]}', so drop the closing ']}'
+    yield _encoder.encode(response)[:-2]
+    for start in range(0, len(entries), chunk_size):
+        chunk = _encoder.encode(entries[start : start + chunk_size])
+        yield chunk[1:-1] if start == 0 else b"," + chunk[1:-1]
+    yield b"]}"
@@ -66,9 +66,60 @@ class MCPToolList(BaseModel):
     )
 
 
-# Predefined MCP resources
+# Shared schema fragments. These dicts are referenced by several resources and
+# tools below, and the public ones also by the tool listing in app/routes/tools.py,
+# so each is built once at import and must not be mutated.
+_LOG_LEVELS = ["DEBUG", "INFO", "WARN", "ERROR"]
+_TIME_RANGES = ["1h", "6h", "24h", "7d", "30d"]
+_DEPLOY_ENVIRONMENTS = ["development", "staging", "production"]
+_ROLLBACK_ENVIRONMENTS = ["staging", "production"]
+
+SERVICE_PROP = {"type": "string", "description": "Filter by service name"}
+METRIC_TYPE_PROP = {"type": "string", "description": "Type of metric to retrieve"}
+_SINCE_DESCRIPTION = "Filter logs since timestamp (ISO format)"
+
+LEVEL_PROP = {
+    "type": "string",
+    "enum": _LOG_LEVELS,
+    "description": "Log level filter",
+}
+LIMIT_100 = {
+    "type": "integer",
+    "minimum": 1,
+    "maximum": 1000,
+    "default": 100,
+    "description": "Limit number of results",
+}
+LIMIT_50 = {
+    "type": "integer",
+    "minimum": 1,
+    "maximum": 1000,
+    "default": 50,
+    "description": "Limit number of results",
+}
+DEPLOY_ENV_PROP = {
+    "type": "string",
+    "enum": _DEPLOY_ENVIRONMENTS,
+    "description": "Target environment",
+}
+ROLLBACK_ENV_PROP = {
+    "type": "string",
+    "enum": _ROLLBACK_ENVIRONMENTS,
+    "description": "Environment to rollback",
+}
+SESSION_TOKEN_PROP = {
+    "type": "string",
+    "description": "Descope session token",
+    "minLength": 1,
+}
+REFRESH_TOKEN_PROP = {
+    "type": "string",
+    "description": "Descope refresh token (optional)",
+}
+
+# Predefined MCP resources (trusted constants, built without validation)
 MCP_RESOURCES = [
-    MCPResource(
+    MCPResource.model_construct(
         uri="logs",
         name="System Logs",
         description="Application and system logs with filtering capabilities",
@@ -81,14 +132,11 @@ MCP_RESOURCES = [
         filters={
             "level": {
                 "type": "enum",
-                "values": ["DEBUG", "INFO", "WARN", "ERROR"],
+                "values": _LOG_LEVELS,
                 "description": "Filter by log level",
             },
-            "service": {"type": "string", "description": "Filter by service name"},
-            "since": {
-                "type": "datetime",
-                "description": "Filter logs since timestamp (ISO format)",
-            },
+            "service": SERVICE_PROP,
+            "since": {"type": "datetime", "description": _SINCE_DESCRIPTION},
             "limit": {
                 "type": "integer",
                 "min": 1,
@@ -98,7 +146,7 @@ MCP_RESOURCES = [
             },
         },
     ),
-    MCPResource(
+    MCPResource.model_construct(
         uri="metrics",
         name="System Metrics",
         description="Performance and health metrics with optional filtering",
@@ -109,14 +157,11 @@ MCP_RESOURCES = [
             "real_time": False,
         },
         filters={
-            "service": {"type": "string", "description": "Filter by service name"},
-            "metric_type": {
-                "type": "string",
-                "description": "Type of metric to retrieve",
-            },
+            "service": SERVICE_PROP,
+            "metric_type": METRIC_TYPE_PROP,
             "time_range": {
                 "type": "enum",
-                "values": ["1h", "6h", "24h", "7d", "30d"],
+                "values": _TIME_RANGES,
                 "default": "1h",
                 "description": "Time range for metrics",
             },
@@ -131,9 +176,9 @@ MCP_RESOURCES = [
     ),
 ]
 
-# Predefined MCP tools
+# Predefined MCP tools (trusted constants, built without validation)
 MCP_TOOLS = [
-    MCPTool(
+    MCPTool.model_construct(
         name="deploy_service",
         description="Deploy a service to a specific environment",
         inputSchema={
@@ -149,17 +194,13 @@ MCP_TOOLS = [
                     "description": "Version to deploy",
                     "minLength": 1,
                 },
-                "environment": {
-                    "type": "string",
-                    "enum": ["development", "staging", "production"],
-                    "description": "Target environment",
-                },
+                "environment": DEPLOY_ENV_PROP,
             },
             "required": ["service_name", "version", "environment"],
             "additionalProperties": False,
         },
         capabilities={
-            "environments": ["development", "staging", "production"],
+            "environments": _DEPLOY_ENVIRONMENTS,
             "rollback": True,
             "validation": True,
         },
@@ -171,7 +212,7 @@ MCP_TOOLS = [
             }
         ],
     ),
-    MCPTool(
+    MCPTool.model_construct(
         name="rollback_deployment",
         description="Rollback a deployment to previous version",
         inputSchema={
@@ -187,17 +228,13 @@ MCP_TOOLS = [
                     "description": "Reason for the rollback",
                     "minLength": 1,
                 },
-                "environment": {
-                    "type": "string",
-                    "enum": ["staging", "production"],
-                    "description": "Environment to rollback",
-                },
+                "environment": ROLLBACK_ENV_PROP,
             },
             "required": ["deployment_id", "reason", "environment"],
             "additionalProperties": False,
         },
         capabilities={
-            "environments": ["staging", "production"],
+            "environments": _ROLLBACK_ENVIRONMENTS,
             "validation": True,
             "audit": True,
         },
@@ -209,21 +246,14 @@ MCP_TOOLS = [
             }
         ],
     ),
-    MCPTool(
+    MCPTool.model_construct(
         name="authenticate_user",
         description="Authenticate user and get permissions",
         inputSchema={
             "type": "object",
             "properties": {
-                "session_token": {
-                    "type": "string",
-                    "description": "Descope session token",
-                    "minLength": 1,
-                },
-                "refresh_token": {
-                    "type": "string",
-                    "description": "Descope refresh token (optional)",
-                },
+                "session_token": SESSION_TOKEN_PROP,
+                "refresh_token": REFRESH_TOKEN_PROP,
             },
             "required": ["session_token"],
             "additionalProperties": False,
@@ -240,30 +270,20 @@ MCP_TOOLS = [
             }
         ],
     ),
-    MCPTool(
+    MCPTool.model_construct(
         name="getMcpResourcesLogs",
         description="Get system logs with optional filtering",
         inputSchema={
             "type": "object",
             "properties": {
-                "level": {
-                    "type": "string",
-                    "enum": ["DEBUG", "INFO", "WARN", "ERROR"],
-                    "description": "Log level filter",
-                },
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 1000,
-                    "default": 100,
-                    "description": "Limit number of results",
-                },
+                "level": LEVEL_PROP,
+                "limit": LIMIT_100,
                 "since": {
                     "type": "string",
                     "format": "date-time",
-                    "description": "Filter logs since timestamp (ISO format)",
+                    "description": _SINCE_DESCRIPTION,
                 },
-                "service": {"type": "string", "description": "Filter by service name"},
+                "service": SERVICE_PROP,
             },
             "additionalProperties": False,
         },
@@ -273,27 +293,18 @@ MCP_TOOLS = [
             "real_time": False,
         },
     ),
-    MCPTool(
+    MCPTool.model_construct(
         name="getMcpResourcesMetrics",
         description="Get performance metrics with optional filtering",
         inputSchema={
             "type": "object",
             "properties": {
-                "limit": {
-                    "type": "integer",
-                    "minimum": 1,
-                    "maximum": 1000,
-                    "default": 50,
-                    "description": "Limit number of results",
-                },
-                "service": {"type": "string", "description": "Filter by service name"},
-                "metric_type": {
-                    "type": "string",
-                    "description": "Type of metric to retrieve",
-                },
+                "limit": LIMIT_50,
+                "service": SERVICE_PROP,
+                "metric_type": METRIC_TYPE_PROP,
                 "time_range": {
                     "type": "string",
-                    "enum": ["1h", "6h", "24h", "7d", "30d"],
+                    "enum": _TIME_RANGES,
                     "default": "1h",
                     "description": "Time range for metrics",
                 },
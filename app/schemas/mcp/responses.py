@@ -1,15 +1,25 @@
 """
 Response models for MCP HTTP Server.
 
-This module contains all Pydantic models for outgoing responses,
-providing consistent structure and type safety for API responses.
+This module contains the Pydantic models for outgoing responses on the
+hot paths (resources and tool calls). Cold-path models such as the health,
+server info and authentication responses live in ``responses_admin`` and
+are imported on first access.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    from .responses_admin import (
+        AuthenticateUserResponse,
+        HealthResponse,
+        ServerInfoResponse,
+        UserData,
+    )
+
 
 class MCPResponse(BaseModel):
     """Base response model for MCP operations."""
@@ -61,7 +71,7 @@ class LogEntry(BaseModel):
 
     level: str = Field(..., description="Log level")
     message: str = Field(..., description="Log message")
-    timestamp: str = Field(..., description="Log timestamp (ISO format)")
+    timestamp: datetime = Field(..., description="Log timestamp")
     source: str = Field(..., description="Log source")
     service: Optional[str] = Field(None, description="Service name")
     user_id: Optional[str] = Field(None, description="User ID")
@@ -75,9 +85,9 @@ class MetricEntry(BaseModel):
     """Model for individual metric entries."""
 
     name: str = Field(..., description="Metric name")
-    value: Union[float, int] = Field(..., description="Metric value")
+    value: float = Field(..., description="Metric value")
     unit: str = Field(..., description="Metric unit")
-    timestamp: str = Field(..., description="Metric timestamp (ISO format)")
+    timestamp: datetime = Field(..., description="Metric timestamp")
     service: Optional[str] = Field(None, description="Service name")
     tags: Optional[Dict[str, str]] = Field(None, description="Metric tags")
     is_loading: Optional[bool] = Field(
@@ -93,7 +103,7 @@ class DeploymentData(BaseModel):
     version: str = Field(..., description="Deployed version")
     environment: str = Field(..., description="Target environment")
     status: str = Field(..., description="Deployment status")
-    timestamp: str = Field(..., description="Deployment timestamp (ISO format)")
+    timestamp: datetime = Field(..., description="Deployment timestamp")
     deployed_by: Optional[str] = Field(None, description="User who deployed")
     build_number: Optional[int] = Field(None, description="Build number")
     commit_hash: Optional[str] = Field(None, description="Git commit hash")
@@ -112,7 +122,7 @@ class RollbackData(BaseModel):
     reason: str = Field(..., description="Rollback reason")
     environment: str = Field(..., description="Environment being rolled back")
     status: str = Field(..., description="Rollback status")
-    timestamp: str = Field(..., description="Rollback timestamp (ISO format)")
+    timestamp: datetime = Field(..., description="Rollback timestamp")
     rolled_back_by: Optional[str] = Field(
         None, description="User who initiated rollback"
     )
@@ -124,30 +134,29 @@ class RollbackData(BaseModel):
     )
 
 
-class UserData(BaseModel):
-    """Model for user data."""
+class LogsFilter(BaseModel):
+    """Model for filters applied to the logs resource."""
+
+    level: Optional[str] = Field(None, description="Log level filter")
+    limit: int = Field(..., description="Maximum number of logs returned")
+    since: Optional[str] = Field(None, description="Logs since timestamp (ISO)")
+    service: Optional[str] = Field(None, description="Service name filter")
 
-    user_id: str = Field(..., description="User ID")
-    login_id: Optional[str] = Field(None, description="Login ID")
-    email: str = Field(..., description="User email")
-    name: str = Field(..., description="User name")
-    tenant: str = Field(..., description="User tenant")
-    roles: List[str] = Field(..., description="User roles")
-    permissions: List[str] = Field(..., description="User permissions")
-    scopes: Optional[List[str]] = Field(None, description="User scopes")
-    authenticated: Optional[bool] = Field(
-        True, description="Whether user is authenticated"
-    )
-    last_login: Optional[str] = Field(None, description="Last login timestamp")
-    is_loading: Optional[bool] = Field(
-        False, description="Whether this is loading data"
-    )
+
+class MetricsFilter(BaseModel):
+    """Model for filters applied to the metrics resource."""
+
+    limit: int = Field(..., description="Maximum number of metrics returned")
+    service: Optional[str] = Field(None, description="Service name filter")
+    metric_type: Optional[str] = Field(None, description="Metric type filter")
+    time_range: Optional[str] = Field(None, description="Time range filter")
 
 
 class LogsResponse(ResourceResponse):
     """Response model for logs resource."""
 
     type: str = Field("logs", description="Resource type")
+    filters: Optional[LogsFilter] = Field(None, description="Applied filters")
     data: List[LogEntry] = Field(..., description="Log entries")
 
 
@@ -155,6 +164,7 @@ class MetricsResponse(ResourceResponse):
     """Response model for metrics resource."""
 
     type: str = Field("metrics", description="Resource type")
+    filters: Optional[MetricsFilter] = Field(None, description="Applied filters")
     data: List[MetricEntry] = Field(..., description="Metric entries")
 
 
@@ -172,35 +182,15 @@ class RollbackDeploymentResponse(ToolResponse):
     result: Optional[RollbackData] = Field(None, description="Rollback result")
 
 
-class AuthenticateUserResponse(ToolResponse):
-    """Response model for authenticate user tool."""
-
-    tool: str = Field("authenticate_user", description="Tool name")
-    result: Optional[UserData] = Field(None, description="User data result")
-
+_ADMIN_MODELS = frozenset(
+    {"AuthenticateUserResponse", "HealthResponse", "ServerInfoResponse", "UserData"}
+)
 
-class ServerInfoResponse(MCPResponse):
-    """Response model for server information."""
 
-    success: bool = Field(True, description="Always true for server info")
-    name: str = Field(..., description="Server name")
-    version: str = Field(..., description="Server version")
-    protocol: str = Field(..., description="Protocol name")
-    description: str = Field(..., description="Server description")
-    capabilities: Dict[str, Any] = Field(..., description="Server capabilities")
-    resources: Dict[str, str] = Field(..., description="Available resources")
-    tools: Dict[str, str] = Field(..., description="Available tools")
-    endpoints: Optional[Dict[str, str]] = Field(None, description="API endpoints")
+def __getattr__(name):
+    # Build the cold-path model schemas only when something asks for them
+    if name in _ADMIN_MODELS:
+        from . import responses_admin
 
-
-class HealthResponse(MCPResponse):
-    """Response model for health checks."""
-
-    success: bool = Field(True, description="Always true for health checks")
-    status: str = Field(..., description="Health status")
-    service: str = Field(..., description="Service name")
-    version: str = Field(..., description="Service version")
-    uptime: Optional[str] = Field(None, description="Service uptime")
-    dependencies: Optional[Dict[str, str]] = Field(
-        None, description="Dependency status"
-    )
+        return getattr(responses_admin, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
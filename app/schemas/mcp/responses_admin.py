@@ -0,0 +1,67 @@
+"""
+Cold-path response models for MCP HTTP Server.
+
+This module contains the Pydantic models for health, server information
+and authentication responses. They are not used on the request hot paths,
+so ``responses`` imports them lazily.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .responses import MCPResponse, ToolResponse
+
+
+class UserData(BaseModel):
+    """Model for user data."""
+
+    user_id: str = Field(..., description="User ID")
+    login_id: Optional[str] = Field(None, description="Login ID")
+    email: str = Field(..., description="User email")
+    name: str = Field(..., description="User name")
+    tenant: str = Field(..., description="User tenant")
+    roles: List[str] = Field(..., description="User roles")
+    permissions: List[str] = Field(..., description="User permissions")
+    scopes: Optional[List[str]] = Field(None, description="User scopes")
+    authenticated: Optional[bool] = Field(
+        True, description="Whether user is authenticated"
+    )
+    last_login: Optional[str] = Field(None, description="Last login timestamp")
+    is_loading: Optional[bool] = Field(
+        False, description="Whether this is loading data"
+    )
+
+
+class AuthenticateUserResponse(ToolResponse):
+    """Response model for authenticate user tool."""
+
+    tool: str = Field("authenticate_user", description="Tool name")
+    result: Optional[UserData] = Field(None, description="User data result")
+
+
+class ServerInfoResponse(MCPResponse):
+    """Response model for server information."""
+
+    success: bool = Field(True, description="Always true for server info")
+    name: str = Field(..., description="Server name")
+    version: str = Field(..., description="Server version")
+    protocol: str = Field(..., description="Protocol name")
+    description: str = Field(..., description="Server description")
+    capabilities: Dict[str, Any] = Field(..., description="Server capabilities")
+    resources: Dict[str, str] = Field(..., description="Available resources")
+    tools: Dict[str, str] = Field(..., description="Available tools")
+    endpoints: Optional[Dict[str, str]] = Field(None, description="API endpoints")
+
+
+class HealthResponse(MCPResponse):
+    """Response model for health checks."""
+
+    success: bool = Field(True, description="Always true for health checks")
+    status: str = Field(..., description="Health status")
+    service: str = Field(..., description="Service name")
+    version: str = Field(..., description="Service version")
+    uptime: Optional[str] = Field(None, description="Service uptime")
+    dependencies: Optional[Dict[str, str]] = Field(
+        None, description="Dependency status"
+    )
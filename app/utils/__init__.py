@@ -5,6 +5,13 @@ This package contains utility functions and classes that are used
 across different parts of the application.
 """
 
-from .dummy_data import DummyDataGenerator
-
 __all__ = ["DummyDataGenerator"]
+
+
+def __getattr__(name):
+    # Resolve heavy utilities lazily so importing the package stays cheap
+    if name == "DummyDataGenerator":
+        from .dummy_data import DummyDataGenerator
+
+        return DummyDataGenerator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,62 @@
+"""
+Circuit breaker for MCP HTTP Server.
+
+When the Cequence Gateway keeps failing, every tool call would otherwise pay
+the gateway round trip (or timeout) before falling back to direct mode. The
+breaker opens after repeated failures so calls skip the gateway for a while.
+"""
+
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker with a fixed cool-down."""
+
+    __slots__ = (
+        "name",
+        "_failure_threshold",
+        "_reset_timeout",
+        "_failures",
+        "_opened_until",
+    )
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0
+    ):
+        """
+        Initialize the circuit breaker.
+
+        Args:
+            name: Name of the protected dependency, used in log messages
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a retry
+        """
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_until = 0.0
+
+    def allow(self) -> bool:
+        """Return True if a call may be attempted (the breaker is not open)."""
+        return time.monotonic() >= self._opened_until
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        self._failures += 1
+        if self._failures >= self._failure_threshold:
+            self._opened_until = time.monotonic() + self._reset_timeout
+            # One more failure after the cool-down reopens it straight away
+            self._failures = self._failure_threshold - 1
+            logger.warning(
+                "⚡ %s circuit opened for %.0fs after repeated failures",
+                self.name,
+                self._reset_timeout,
+            )
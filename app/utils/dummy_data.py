@@ -7,11 +7,38 @@ while real API calls are being processed in the background.
 
 import logging
 import random
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Prefix marking generated log messages as placeholder data
+LOADING_PREFIX = "LOADING: "
+
+
+@dataclass(slots=True, frozen=True)
+class DummyLogRecord:
+    """Generated placeholder log entry."""
+
+    level: str
+    message: str
+    timestamp: str
+    source: str
+    _is_loading: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class DummyMetricRecord:
+    """Generated placeholder metric entry."""
+
+    name: str
+    value: float
+    unit: str
+    service: str
+    timestamp: str
+    _is_loading: bool = True
+
 
 class DummyDataGenerator:
     """
@@ -133,16 +160,65 @@ class DummyDataGenerator:
         "Network error",
     ]
 
-    def __init__(self):
-        """Initialize the dummy data generator."""
-        self.base_time = datetime.now(timezone.utc)
+    # Statuses for generated deployments and rollbacks
+    DEPLOYMENT_STATUSES = ("pending", "in_progress", "completed", "failed")
+
+    # User attributes for generating realistic user data
+    USER_NAMES = (
+        "John Doe",
+        "Jane Smith",
+        "Bob Johnson",
+        "Alice Brown",
+        "Charlie Wilson",
+    )
+    USER_EMAILS = (
+        "john@example.com",
+        "jane@example.com",
+        "bob@example.com",
+        "alice@example.com",
+        "charlie@example.com",
+    )
+    USER_ROLES = ("developer", "admin", "observer", "manager")
+    USER_PERMISSIONS = (
+        "read_logs",
+        "read_metrics",
+        "deploy_staging",
+        "deploy_production",
+        "rollback_staging",
+        "rollback_production",
+    )
+
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the dummy data generator.
+
+        Args:
+            seed: Optional seed for a reproducible random sequence
+        """
+        self._rng = random.Random(seed)
+        # Bound RNG methods, looked up once instead of on every draw
+        self._choice = self._rng.choice
+        self._choices = self._rng.choices
+        self._randint = self._rng.randint
+        self._uniform = self._rng.uniform
+        self._sample = self._rng.sample
+        self._getrandbits = self._rng.getrandbits
+        self._placeholder_generators = self._build_placeholder_generators()
+        # Index templates by level once so a level filter is a dict lookup
+        self._templates_by_level: Dict[str, List[Dict[str, str]]] = {}
+        for template in self.LOG_TEMPLATES:
+            self._templates_by_level.setdefault(template["level"], []).append(template)
+        self._metric_configs = [
+            (name, unit, self._make_metric_value_fn(unit, min_val, max_val))
+            for name, unit, min_val, max_val in self.METRIC_CONFIGS
+        ]
 
     def generate_logs(
         self,
         count: int = 10,
         level: Optional[str] = None,
         service: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[DummyLogRecord]:
         """
         Generate realistic dummy logs for immediate UI population.
 
@@ -152,44 +228,46 @@ class DummyDataGenerator:
             service: Optional service name filter
 
         Returns:
-            List of log entry dictionaries
+            List of generated log records
         """
         logger.debug(
-            f"Generating {count} dummy logs with level={level}, service={service}"
+            "Generating %s dummy logs with level=%s, service=%s", count, level, service
         )
 
+        base_time = datetime.now(timezone.utc)
         dummy_logs = []
         templates_to_use = self.LOG_TEMPLATES
 
         # Filter templates by level if specified
         if level:
-            templates_to_use = [t for t in self.LOG_TEMPLATES if t["level"] == level]
+            templates_to_use = self._templates_by_level.get(level)
             if not templates_to_use:
                 # If no templates match, create a generic one
                 templates_to_use = [
                     {"level": level, "message": "System event logged - id={event_id}"}
                 ]
 
-        for i in range(count):
-            template = random.choice(templates_to_use)
+        # Draw templates, timestamp steps and services for the whole batch at once
+        templates = self._choices(templates_to_use, k=count)
+        minute_steps = self._choices(range(1, 6), k=count)
+        log_services = self._draw_services(service, count)
 
+        for i, (template, step, log_service) in enumerate(
+            zip(templates, minute_steps, log_services)
+        ):
             # Generate realistic values for placeholders
             message = self._format_log_message(template["message"])
 
             # Generate timestamp (more recent logs first)
-            log_time = self.base_time - timedelta(minutes=i * random.randint(1, 5))
-
-            # Generate service name if not specified
-            log_service = service or random.choice(self.SERVICE_NAMES)
+            log_time = base_time - timedelta(minutes=i * step)
 
             dummy_logs.append(
-                {
-                    "level": template["level"],
-                    "message": f"LOADING: {message}",
-                    "timestamp": log_time.isoformat(),
-                    "source": log_service,
-                    "_is_loading": True,
-                }
+                DummyLogRecord(
+                    level=template["level"],
+                    message=LOADING_PREFIX + message,
+                    timestamp=log_time.isoformat(),
+                    source=log_service,
+                )
             )
 
         return dummy_logs
@@ -199,7 +277,7 @@ class DummyDataGenerator:
         count: int = 5,
         service: Optional[str] = None,
         metric_type: Optional[str] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> List[DummyMetricRecord]:
         """
         Generate realistic dummy metrics for immediate UI population.
 
@@ -209,48 +287,45 @@ class DummyDataGenerator:
             metric_type: Optional metric type filter
 
         Returns:
-            List of metric dictionaries
+            List of generated metric records
         """
         logger.debug(
-            f"Generating {count} dummy metrics with service={service}, type={metric_type}"
+            "Generating %s dummy metrics with service=%s, type=%s",
+            count,
+            service,
+            metric_type,
         )
 
+        # Every metric in a batch shares the same timestamp, so format it once
+        timestamp = datetime.now(timezone.utc).isoformat()
         dummy_metrics = []
-        configs_to_use = self.METRIC_CONFIGS
+        configs_to_use = self._metric_configs
 
         # Filter by metric type if specified
         if metric_type:
             configs_to_use = [
-                c for c in self.METRIC_CONFIGS if metric_type.lower() in c[0].lower()
+                c for c in self._metric_configs if metric_type.lower() in c[0].lower()
             ]
             if not configs_to_use:
-                configs_to_use = self.METRIC_CONFIGS[:count]
+                configs_to_use = self._metric_configs[:count]
+
+        configs_to_use = configs_to_use[:count]
+        metric_services = self._draw_services(service, len(configs_to_use))
 
-        for i, (name, unit, min_val, max_val) in enumerate(configs_to_use[:count]):
+        for (name, unit, value_fn), metric_service in zip(
+            configs_to_use, metric_services
+        ):
             # Generate realistic values based on metric type and range
-            if "percent" in unit:
-                value = round(random.uniform(min_val, max_val), 2)
-            elif "count" in unit:
-                value = random.randint(int(min_val), int(max_val))
-            elif "bytes" in unit:
-                value = random.randint(int(min_val), int(max_val))
-            elif "milliseconds" in unit:
-                value = round(random.uniform(min_val, max_val), 2)
-            else:
-                value = round(random.uniform(min_val, max_val), 2)
-
-            # Generate service name if not specified
-            metric_service = service or random.choice(self.SERVICE_NAMES)
+            value = value_fn()
 
             dummy_metrics.append(
-                {
-                    "name": name,
-                    "value": value,
-                    "unit": unit,
-                    "service": metric_service,
-                    "timestamp": self.base_time.isoformat(),
-                    "_is_loading": True,
-                }
+                DummyMetricRecord(
+                    name=name,
+                    value=value,
+                    unit=unit,
+                    service=metric_service,
+                    timestamp=timestamp,
+                )
             )
 
         return dummy_metrics
@@ -270,23 +345,28 @@ class DummyDataGenerator:
             Dictionary containing deployment data
         """
         logger.debug(
-            f"Generating dummy deployment data for {service_name} v{version} to {environment}"
+            "Generating dummy deployment data for %s v%s to %s",
+            service_name,
+            version,
+            environment,
         )
 
-        deployment_id = f"deploy-{random.randint(100000, 999999)}"
-        statuses = ["pending", "in_progress", "completed", "failed"]
-        status = random.choice(statuses)
+        # One draw supplies every random field, split off in mixed radix
+        bits, deployment_n = divmod(self._getrandbits(96), 900000)
+        bits, user_n = divmod(bits, 9000)
+        bits, build_n = divmod(bits, 1000)
 
         return {
-            "deployment_id": deployment_id,
+            "deployment_id": f"deploy-{100000 + deployment_n}",
             "service_name": service_name,
             "version": version,
             "environment": environment,
-            "status": status,
-            "timestamp": self.base_time.isoformat(),
-            "deployed_by": f"user-{random.randint(1000, 9999)}",
-            "build_number": random.randint(1, 1000),
-            "commit_hash": f"{random.randint(1000000, 9999999):x}",
+            # Four statuses, so two random bits pick one uniformly
+            "status": self.DEPLOYMENT_STATUSES[bits & 3],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "deployed_by": f"user-{1000 + user_n}",
+            "build_number": 1 + build_n,
+            "commit_hash": f"{(bits >> 2) & 0xFFFFFFF:07x}",
             "_is_loading": True,
         }
 
@@ -305,22 +385,25 @@ class DummyDataGenerator:
             Dictionary containing rollback data
         """
         logger.debug(
-            f"Generating dummy rollback data for {deployment_id} in {environment}"
+            "Generating dummy rollback data for %s in %s", deployment_id, environment
         )
 
-        rollback_id = f"rollback-{random.randint(100000, 999999)}"
-        statuses = ["pending", "in_progress", "completed", "failed"]
-        status = random.choice(statuses)
+        # One draw supplies every random field, split off in mixed radix
+        bits, rollback_n = divmod(self._getrandbits(64), 900000)
+        bits, user_n = divmod(bits, 9000)
+        bits, version_n = divmod(bits, 1000)
+        major, minor, patch = version_n // 100, version_n // 10 % 10, version_n % 10
 
         return {
-            "rollback_id": rollback_id,
+            "rollback_id": f"rollback-{100000 + rollback_n}",
             "deployment_id": deployment_id,
             "reason": reason,
             "environment": environment,
-            "status": status,
-            "timestamp": self.base_time.isoformat(),
-            "rolled_back_by": f"user-{random.randint(1000, 9999)}",
-            "previous_version": f"v{random.randint(1, 10)}.{random.randint(0, 9)}.{random.randint(0, 9)}",
+            # Four statuses, so two random bits pick one uniformly
+            "status": self.DEPLOYMENT_STATUSES[bits & 3],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "rolled_back_by": f"user-{1000 + user_n}",
+            "previous_version": f"v{major + 1}.{minor}.{patch}",
             "_is_loading": True,
         }
 
@@ -334,105 +417,144 @@ class DummyDataGenerator:
         Returns:
             Dictionary containing user data
         """
-        logger.debug(f"Generating dummy user data for {user_id}")
-
-        names = [
-            "John Doe",
-            "Jane Smith",
-            "Bob Johnson",
-            "Alice Brown",
-            "Charlie Wilson",
-        ]
-        emails = [
-            "john@example.com",
-            "jane@example.com",
-            "bob@example.com",
-            "alice@example.com",
-            "charlie@example.com",
-        ]
-        roles = ["developer", "admin", "observer", "manager"]
+        logger.debug("Generating dummy user data for %s", user_id)
 
         return {
             "user_id": user_id,
-            "name": random.choice(names),
-            "email": random.choice(emails),
-            "roles": random.sample(roles, random.randint(1, 3)),
-            "permissions": random.sample(
-                [
-                    "read_logs",
-                    "read_metrics",
-                    "deploy_staging",
-                    "deploy_production",
-                    "rollback_staging",
-                    "rollback_production",
-                ],
-                random.randint(2, 5),
-            ),
+            "name": self._choice(self.USER_NAMES),
+            "email": self._choice(self.USER_EMAILS),
+            "roles": self._sample(self.USER_ROLES, self._randint(1, 3)),
+            "permissions": self._sample(self.USER_PERMISSIONS, self._randint(2, 5)),
             "last_login": (
-                self.base_time - timedelta(hours=random.randint(1, 24))
+                datetime.now(timezone.utc) - timedelta(hours=self._randint(1, 24))
             ).isoformat(),
-            "tenant": f"tenant-{random.randint(1, 10)}",
+            "tenant": f"tenant-{self._randint(1, 10)}",
             "_is_loading": True,
         }
 
-    def _format_log_message(self, template: str) -> str:
+    def _draw_services(self, service: Optional[str], count: int) -> List[str]:
         """
-        Format a log message template with realistic values.
+        Draw service names for a batch of generated records.
 
         Args:
-            template: Message template with placeholders
+            service: Optional service name to use for every record
+            count: Number of service names to draw
 
         Returns:
-            Formatted message string
+            List of ``count`` service names
+        """
+        if service:
+            return [service] * count
+        return self._choices(self.SERVICE_NAMES, k=count)
+
+    def _make_metric_value_fn(
+        self, unit: str, min_val: float, max_val: float
+    ) -> Callable[[], float]:
         """
-        replacements = {
-            "user_id": random.randint(10000, 99999),
-            "time": random.randint(50, 300),
-            "duration": random.randint(10, 500),
-            "rows": random.randint(1, 100),
-            "memory": random.randint(60, 95),
-            "session": random.randint(1000, 9999),
-            "ttl": random.randint(300, 3600),
-            "requests": random.randint(500, 950),
-            "service": random.choice(self.SERVICE_NAMES),
-            "usage": random.randint(70, 95),
-            "available": random.randint(5, 50),
-            "uptime": random.randint(24, 720),
-            "event_id": random.randint(100000, 999999),
-            "function": random.choice(
-                ["process_request", "validate_user", "save_data", "send_notification"]
+        Build the value generator for a metric based on its unit and range.
+
+        Args:
+            unit: Metric unit
+            min_val: Lower bound of the generated values
+            max_val: Upper bound of the generated values
+
+        Returns:
+            Zero-argument function returning a realistic metric value
+        """
+        if "count" in unit or "bytes" in unit:
+            randint = self._randint
+            low, high = int(min_val), int(max_val)
+            return lambda: randint(low, high)
+
+        uniform = self._uniform
+        return lambda: round(uniform(min_val, max_val), 2)
+
+    def _build_placeholder_generators(self) -> Dict[str, Callable[[], Any]]:
+        """
+        Build the value generator for each log message placeholder.
+
+        Returns:
+            Mapping of placeholder name to a zero-argument value generator
+        """
+        choice = self._choice
+        randint = self._randint
+
+        return {
+            "user_id": lambda: randint(10000, 99999),
+            "time": lambda: randint(50, 300),
+            "duration": lambda: randint(10, 500),
+            "rows": lambda: randint(1, 100),
+            "memory": lambda: randint(60, 95),
+            "session": lambda: randint(1000, 9999),
+            "ttl": lambda: randint(300, 3600),
+            "requests": lambda: randint(500, 950),
+            "service": lambda: choice(self.SERVICE_NAMES),
+            "usage": lambda: randint(70, 95),
+            "available": lambda: randint(5, 50),
+            "uptime": lambda: randint(24, 720),
+            "event_id": lambda: randint(100000, 999999),
+            "function": lambda: choice(
+                ("process_request", "validate_user", "save_data", "send_notification")
             ),
-            "line": random.randint(10, 200),
-            "variable": random.choice(
-                ["user_id", "request_id", "session_token", "response_data"]
+            "line": lambda: randint(10, 200),
+            "variable": lambda: choice(
+                ("user_id", "request_id", "session_token", "response_data")
             ),
-            "host": f"db-{random.randint(1, 5)}.example.com",
-            "port": random.choice([3306, 5432, 6379, 27017]),
-            "error": random.choice(self.ERROR_MESSAGES),
-            "filename": f"file_{random.randint(1, 1000)}.pdf",
-            "size": random.randint(1024, 10485760),  # 1KB to 10MB
-            "query": random.choice(
-                ["SELECT * FROM users", "UPDATE sessions SET", "INSERT INTO logs"]
+            "host": lambda: f"db-{randint(1, 5)}.example.com",
+            "port": lambda: choice((3306, 5432, 6379, 27017)),
+            "error": lambda: choice(self.ERROR_MESSAGES),
+            "filename": lambda: f"file_{randint(1, 1000)}.pdf",
+            "size": lambda: randint(1024, 10485760),  # 1KB to 10MB
+            "query": lambda: choice(
+                ("SELECT * FROM users", "UPDATE sessions SET", "INSERT INTO logs")
             ),
         }
 
+    def _format_log_message(self, template: str) -> str:
+        """
+        Format a log message template with realistic values.
+
+        Only the placeholders that appear in the template are generated.
+
+        Args:
+            template: Message template with placeholders
+
+        Returns:
+            Formatted message string
+        """
         try:
-            return template.format(**replacements)
+            return template.format_map(_LazyReplacements(self._placeholder_generators))
         except KeyError as e:
-            logger.warning(f"Missing replacement for placeholder: {e}")
+            logger.warning("Missing replacement for placeholder: %s", e)
             return template
 
 
+class _LazyReplacements(dict):
+    """Placeholder values for one log message, generated on first lookup."""
+
+    __slots__ = ("_generators",)
+
+    def __init__(self, generators: Dict[str, Callable[[], Any]]):
+        super().__init__()
+        self._generators = generators
+
+    def __missing__(self, key: str) -> Any:
+        value = self[key] = self._generators[key]()
+        return value
+
+
+# Global instance
+dummy_generator = DummyDataGenerator()
+
+
 # Convenience functions for backward compatibility
 def generate_dummy_logs(
     count: int = 10, level: Optional[str] = None
-) -> List[Dict[str, Any]]:
-    """Generate dummy logs using the DummyDataGenerator."""
-    generator = DummyDataGenerator()
-    return generator.generate_logs(count=count, level=level)
+) -> List[DummyLogRecord]:
+    """Generate dummy logs using the shared DummyDataGenerator."""
+    return dummy_generator.generate_logs(count=count, level=level)
 
 
-def generate_dummy_metrics(count: int = 5) -> List[Dict[str, Any]]:
-    """Generate dummy metrics using the DummyDataGenerator."""
-    generator = DummyDataGenerator()
-    return generator.generate_metrics(count=count)
+def generate_dummy_metrics(count: int = 5) -> List[DummyMetricRecord]:
+    """Generate dummy metrics using the shared DummyDataGenerator."""
+    return dummy_generator.generate_metrics(count=count)
@@ -0,0 +1,29 @@
+"""
+JSON response class for MCP HTTP Server.
+
+Most tool endpoints return plain dicts, which FastAPI renders through the
+application's default response class. This module provides an orjson-backed
+replacement that falls back to the standard library encoder when orjson is
+not installed.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        if not ORJSON_AVAILABLE:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
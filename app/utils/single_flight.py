@@ -0,0 +1,75 @@
+"""
+Single-flight result sharing for MCP HTTP Server.
+
+Concurrent identical reads (e.g. many clients polling the logs resource with
+the same filters) await one upstream call instead of issuing one each, and
+the result is reused for a short TTL afterwards.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """Share one in-flight (or just-finished) call per key between callers."""
+
+    def __init__(self, ttl: float = 0.5, max_entries: int = 256):
+        """
+        Initialize the single-flight cache.
+
+        Args:
+            ttl: Seconds a finished result is reused after it completes
+            max_entries: Entry count above which expired entries are pruned
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        # key -> (completion time or None while running, task)
+        self._entries: Dict[Hashable, Tuple[Any, asyncio.Task]] = {}
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the shared result for ``key``, calling ``factory`` if needed.
+
+        Args:
+            key: Hashable identity of the call (e.g. its filter arguments)
+            factory: Zero-argument coroutine function performing the call
+
+        Returns:
+            The result of the shared call
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            finished_at, task = entry
+            if finished_at is None or time.monotonic() - finished_at < self._ttl:
+                # Shield so one caller's cancellation doesn't cancel the others
+                return await asyncio.shield(task)
+
+        if len(self._entries) >= self._max_entries:
+            self._prune()
+
+        task = asyncio.ensure_future(factory())
+        self._entries[key] = (None, task)
+        task.add_done_callback(lambda done: self._on_done(key, done))
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """Record completion time, or forget the entry if the call failed."""
+        entry = self._entries.get(key)
+        if entry is None or entry[1] is not task:
+            return
+        if task.cancelled() or task.exception() is not None:
+            del self._entries[key]
+        else:
+            self._entries[key] = (time.monotonic(), task)
+
+    def _prune(self) -> None:
+        """Drop finished entries whose TTL has expired."""
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (finished_at, _) in self._entries.items()
+            if finished_at is not None and now - finished_at >= self._ttl
+        ]
+        for key in expired:
+            del self._entries[key]
@@ -0,0 +1,77 @@
+"""
+Bounded TTL cache for MCP HTTP Server.
+
+A small in-process map whose entries expire individually, used to reuse
+expensive results (e.g. validated sessions) for a short time.
+"""
+
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Size-bounded mapping whose entries expire after a per-entry TTL."""
+
+    def __init__(self, ttl: float, max_entries: int = 10000):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Default (and maximum) seconds an entry stays valid
+            max_entries: Entry count at which expired and oldest entries are evicted
+        """
+        self._ttl = ttl
+        self._max_entries = max_entries
+        # key -> (expiry time, value)
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for ``key``, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store ``value`` under ``key``.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds the entry is valid, capped at the cache's default TTL
+        """
+        ttl = self._ttl if ttl is None else min(ttl, self._ttl)
+        if ttl <= 0:
+            return
+        if key not in self._entries and len(self._entries) >= self._max_entries:
+            self._evict()
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the oldest ones if still full."""
+        now = time.monotonic()
+        expired = [
+            key for key, (expires_at, _) in self._entries.items() if now >= expires_at
+        ]
+        for key in expired:
+            del self._entries[key]
+        # Dicts keep insertion order, so the first keys are the oldest
+        while len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
@@ -16,12 +16,18 @@ Then clients can:
 - GET /mcp/stream - Server-Sent Events stream for real-time updates
 """
 
+import asyncio
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from app.config import settings
+from app.infrastructure.http_client import close_http_client
 from app.middleware import (
     ErrorHandlingMiddleware,
     GatewayRoutingMiddleware,
@@ -29,26 +35,45 @@ from app.middleware import (
     RequestValidationMiddleware,
 )
 from app.routes import health_router, resources_router, tools_router
+from app.utils.json_response import FastJSONResponse
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=settings.LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size the worker thread pool on startup; release pooled connections on shutdown."""
+    # Blocking Descope SDK calls run in the default executor via to_thread;
+    # the stock pool (min(32, cpus + 4)) is small for network-bound work
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=settings.THREAD_POOL_SIZE, thread_name_prefix="blocking-io"
+        )
+    )
+    yield
+    await close_http_client()
+
+
+# Skip OpenAPI schema and docs UI in production; they aren't served to clients
+_DOCS_ENABLED = settings.ENVIRONMENT != "production"
+
 # Initialize FastAPI app
 app = FastAPI(
     title="DevOps MCP HTTP Server",
     description="Model Context Protocol server for DevOps operations over HTTP",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan,
+    docs_url="/docs" if _DOCS_ENABLED else None,
+    redoc_url="/redoc" if _DOCS_ENABLED else None,
+    openapi_url="/openapi.json" if _DOCS_ENABLED else None,
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Compress larger bodies (logs and metrics listings are repetitive JSON).
+# Added first so it wraps the app directly and sees complete bodies.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 # Add custom middleware (order matters - last added is first executed)
 app.add_middleware(RequestValidationMiddleware, enable_validation=True)
@@ -56,6 +81,17 @@ app.add_middleware(LoggingMiddleware, enable_detailed_logging=True)
 app.add_middleware(ErrorHandlingMiddleware, enable_error_logging=True)
 app.add_middleware(GatewayRoutingMiddleware, enable_gateway_routing=True)
 
+# Add CORS middleware last so it runs first: preflight requests are answered
+# before the custom middleware stack, and browsers cache them for max_age
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.CORS_ALLOW_ORIGINS,
+    allow_credentials=True,
+    allow_methods=["GET", "POST"],
+    allow_headers=["authorization", "content-type"],
+    max_age=settings.CORS_MAX_AGE,
+)
+
 # Include routers
 app.include_router(health_router)
 app.include_router(resources_router)
@@ -92,10 +128,43 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8001))
     print(f"🌐 Server: http://localhost:{port}")
 
-    uvicorn.run(
-        "mcp_http_server:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True,
-        log_level="info",
-    )
+    # Auto-reload only in development; it adds a file watcher process
+    reload = settings.ENVIRONMENT == "development"
+    # Caches and the Cequence MCP session live in process memory, so default
+    # to one worker and let WEB_CONCURRENCY opt into more
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+
+    # ASGI_SERVER=granian serves through Granian's Rust HTTP runtime instead
+    server = os.getenv("ASGI_SERVER", "uvicorn").lower()
+    if server == "granian":
+        try:
+            from granian import Granian
+            from granian.constants import Interfaces
+        except ImportError:
+            logger.warning("⚠️ granian not installed - falling back to uvicorn")
+            server = "uvicorn"
+
+    if server == "granian":
+        print("⚡ Serving with Granian")
+        Granian(
+            "mcp_http_server:app",
+            address="0.0.0.0",
+            port=port,
+            interface=Interfaces.ASGI,
+            workers=workers,
+            reload=reload,
+            log_access=False,
+        ).serve()
+    else:
+        uvicorn.run(
+            "mcp_http_server:app",
+            host="0.0.0.0",
+            port=port,
+            loop="uvloop",
+            http="httptools",
+            workers=workers,
+            reload=reload,
+            log_level=settings.LOG_LEVEL.lower(),
+            # LoggingMiddleware already logs every request
+            access_log=False,
+        )